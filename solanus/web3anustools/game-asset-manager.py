@@ -1,8 +1,254 @@
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import count, islice
+from types import MappingProxyType
+import asyncio
+import hashlib
 import logging
+import sys
+import time
 from anus.tools.web3.gamefi_base_tool import GameFiBaseTool
 from anus.tools.base.tool_result import ToolResult
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        """Encode a result payload as compact JSON bytes"""
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+    
+    def _dumps(obj: Any) -> bytes:
+        """Encode a result payload as compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+logger = logging.getLogger("anus.tools.web3.game_asset_manager")
+
+# Default number of actions async_execute_many runs concurrently
+_DEFAULT_BATCH_SIZE = 10
+
+# Seconds a per-game marketplace listing index stays valid
+_LOOKUP_CACHE_TTL = 30
+
+# Seconds a marketplace listing stays active (7 days)
+_LISTING_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Supported blockchain games
+_STATIC_GAMES = (
+    {
+        "id": "axie-infinity",
+        "name": "Axie Infinity",
+        "blockchain": "ronin",
+        "website": "https://axieinfinity.com/",
+        "description": "Collect, battle, and earn with fantasy creatures called Axies"
+    },
+    {
+        "id": "gods-unchained",
+        "name": "Gods Unchained",
+        "blockchain": "ethereum",
+        "website": "https://godsunchained.com/",
+        "description": "Free-to-play tactical card game that gives players true ownership of their in-game items"
+    },
+    {
+        "id": "star-atlas",
+        "name": "Star Atlas",
+        "blockchain": "solana",
+        "website": "https://staratlas.com/",
+        "description": "Next-gen metaverse with AAA-quality game experience built on Solana"
+    },
+    {
+        "id": "illuvium",
+        "name": "Illuvium",
+        "blockchain": "ethereum",
+        "website": "https://illuvium.io/",
+        "description": "Auto-battler RPG with a vast open world to explore"
+    },
+    {
+        "id": "the-sandbox",
+        "name": "The Sandbox",
+        "blockchain": "ethereum",
+        "website": "https://www.sandbox.game/",
+        "description": "Virtual world where players can build, own, and monetize their gaming experiences"
+    }
+)
+
+# Asset templates by game
+_ASSET_TEMPLATES = MappingProxyType({
+    "axie-infinity": (
+        {"type": "character", "rarity": "rare", "class": "aquatic"},
+        {"type": "character", "rarity": "epic", "class": "beast"},
+        {"type": "character", "rarity": "common", "class": "plant"},
+        {"type": "land", "rarity": "common", "region": "savannah"},
+        {"type": "item", "rarity": "epic", "category": "potion"}
+    ),
+    "gods-unchained": (
+        {"type": "card", "rarity": "rare", "god": "nature"},
+        {"type": "card", "rarity": "epic", "god": "death"},
+        {"type": "card", "rarity": "legendary", "god": "light"},
+        {"type": "card", "rarity": "common", "god": "war"},
+        {"type": "cosmetic", "rarity": "epic", "category": "board"}
+    ),
+    "star-atlas": (
+        {"type": "ship", "rarity": "rare", "faction": "oni"},
+        {"type": "ship", "rarity": "epic", "faction": "mud"},
+        {"type": "land", "rarity": "legendary", "region": "nebula"},
+        {"type": "equipment", "rarity": "common", "category": "weapon"},
+        {"type": "crew", "rarity": "rare", "role": "engineer"}
+    )
+})
+
+# Generic assets if game not found
+_GENERIC_TEMPLATES = (
+    {"type": "character", "rarity": "common", "class": "warrior"},
+    {"type": "weapon", "rarity": "rare", "category": "sword"},
+    {"type": "armor", "rarity": "epic", "category": "helmet"},
+    {"type": "consumable", "rarity": "common", "category": "potion"},
+    {"type": "resource", "rarity": "common", "category": "wood"}
+)
+
+# Value multiplier applied to the base asset value by rarity
+_RARITY_MULTIPLIER = MappingProxyType({
+    "common": 1,
+    "uncommon": 2,
+    "rare": 5,
+    "epic": 10,
+    "legendary": 25,
+    "mythic": 100
+})
+
+# Simulated value of an asset before the rarity multiplier
+_BASE_ASSET_VALUE = 10
+
+# Simulated value by rarity, precomputed so per-asset lookups skip the multiply
+_RARITY_VALUE = MappingProxyType({rarity: _BASE_ASSET_VALUE * multiplier for rarity, multiplier in _RARITY_MULTIPLIER.items()})
+
+# Generic stats by asset type as (stat, base, step): the asset at template index i gets base + i * step
+_STAT_FORMULAS = MappingProxyType({
+    **dict.fromkeys(("character", "ship", "card"), (("attack", 5, 2), ("defense", 3, 1), ("health", 10, 3))),
+    **dict.fromkeys(("weapon", "equipment"), (("damage", 3, 2), ("durability", 20, 5))),
+    "land": (("size", 10, 5), ("resources", 2, 1))
+})
+
+
+
+@dataclass(frozen=True, slots=True)
+class GameAsset:
+    """Simulated game asset, shared between calls and serialized with to_dict()"""
+    asset_id: str
+    name: str
+    type: str
+    rarity: str
+    game_id: str
+    transferable: bool = True
+    metadata_uri: str = ""
+    stats: Optional[Dict[str, int]] = None
+    extra: Dict[str, Any] = field(default_factory=dict)  # template-specific traits (class, faction, ...)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the asset to the dict shape returned in tool results"""
+        data = {
+            "asset_id": self.asset_id,
+            "name": self.name,
+            "type": self.type,
+            "rarity": self.rarity,
+            "game_id": self.game_id,
+            "transferable": self.transferable,
+            "metadata_uri": self.metadata_uri
+        }
+        data.update(self.extra)
+        if self.stats:
+            data["stats"] = dict(self.stats)
+        return data
+
+
+@dataclass(slots=True)
+class InventoryEntry:
+    """An owned asset: the shared GameAsset plus the wallet's holding details"""
+    asset: GameAsset
+    quantity: int
+    value: int
+    acquisition_date: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten the entry to the dict shape returned in tool results"""
+        data = self.asset.to_dict()
+        data["quantity"] = self.quantity
+        data["acquisition_date"] = self.acquisition_date
+        data["value"] = self.value
+        return data
+
+
+@lru_cache(maxsize=128)
+def _build_game_assets(game_id: str, asset_type: Optional[str] = None) -> Tuple[GameAsset, ...]:
+    """Build the simulated assets for a game, memoized by (game_id, asset_type)"""
+    templates = _ASSET_TEMPLATES.get(game_id, _GENERIC_TEMPLATES)
+    
+    # Filter by asset type if specified
+    if asset_type:
+        templates = [t for t in templates if t["type"] == asset_type]
+    
+    # Generate assets from templates
+    assets = []
+    for i, template in enumerate(templates):
+        asset_type = template["type"]
+        rarity = template["rarity"]
+        
+        # Template-specific properties
+        extra = {key: value for key, value in template.items() if key not in ["type", "rarity"]}
+        
+        # Add generic stats
+        stats = {stat: base + i * step for stat, base, step in _STAT_FORMULAS.get(asset_type, ())}
+        
+        assets.append(GameAsset(
+            # Interned: asset IDs are the keys of every lookup index
+            asset_id=sys.intern(f"{game_id}-{asset_type}-{i+1}"),
+            name=f"{rarity.capitalize()} {asset_type.capitalize()} #{i+1}",
+            type=asset_type,
+            rarity=rarity,
+            game_id=game_id,
+            transferable=True,
+            metadata_uri=f"https://example.com/games/{game_id}/assets/{asset_type}-{i+1}",
+            stats=stats or None,
+            extra=extra
+        ))
+    
+    return tuple(assets)
+
+
+@lru_cache(maxsize=128)
+def _build_asset_index(game_id: str) -> Dict[str, GameAsset]:
+    """Index all simulated assets of a game by asset ID, memoized alongside _build_game_assets"""
+    return {asset.asset_id: asset for asset in _build_game_assets(game_id, None)}
+
+
+def _page_info(total: int, offset: int, returned: int) -> Dict[str, Any]:
+    """Build the pagination fields of a listing result"""
+    end = offset + returned
+    has_more = end < total
+    return {
+        "offset": offset,
+        "has_more": has_more,
+        "next_offset": end if has_more else None
+    }
+
+
+def _stable_hash(value: str) -> int:
+    """Hash a string to a non-negative int that is identical across processes"""
+    # Built-in hash() is salted per interpreter (PYTHONHASHSEED), which made the
+    # "deterministic" simulation differ between runs
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "little")
+
+
+def _index_by_asset_id(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index assets or listings by asset ID, keeping the first entry for duplicates"""
+    index = {}
+    for item in items:
+        index.setdefault(item["asset_id"], item)
+    return index
+
+
 class GameAssetManager(GameFiBaseTool):
     """
     Tool for managing in-game assets across different blockchain games.
@@ -10,157 +256,239 @@ class GameAssetManager(GameFiBaseTool):
     """
     name = "game_asset_manager"
     description = "Manage in-game assets, inventory, and marketplace transactions for blockchain games"
-    
-    @property
-    def parameters(self) -> Dict:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": [
-                        "list_assets", "get_asset_details", "transfer_asset", 
-                        "list_games", "get_inventory", "check_asset_value",
-                        "list_marketplace", "buy_asset", "sell_asset"
-                    ],
-                    "description": "The game asset action to perform"
-                },
-                "game_id": {
-                    "type": "string",
-                    "description": "Identifier for the game"
-                },
-                "asset_id": {
-                    "type": "string",
-                    "description": "Identifier for the asset"
-                },
-                "wallet_address": {
-                    "type": "string",
-                    "description": "Wallet address for inventory lookup or transfers"
-                },
-                "recipient_address": {
-                    "type": "string",
-                    "description": "Recipient wallet address for transfers"
-                },
-                "quantity": {
-                    "type": "integer",
-                    "description": "Quantity of assets for transactions"
-                },
-                "price": {
-                    "type": "number",
-                    "description": "Price for buying or selling assets"
+    parameters = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": [
+                    "list_assets", "get_asset_details", "transfer_asset", 
+                    "list_games", "get_inventory", "check_asset_value",
+                    "list_marketplace", "buy_asset", "sell_asset",
+                    "batch_transfer_asset", "batch_buy_asset"
+                ],
+                "description": "The game asset action to perform"
+            },
+            "game_id": {
+                "type": "string",
+                "description": "Identifier for the game"
+            },
+            "asset_id": {
+                "type": "string",
+                "description": "Identifier for the asset"
+            },
+            "wallet_address": {
+                "type": "string",
+                "description": "Wallet address for inventory lookup or transfers"
+            },
+            "recipient_address": {
+                "type": "string",
+                "description": "Recipient wallet address for transfers"
+            },
+            "quantity": {
+                "type": "integer",
+                "description": "Quantity of assets for transactions"
+            },
+            "price": {
+                "type": "number",
+                "description": "Price for buying or selling assets"
+            },
+            "marketplace": {
+                "type": "string",
+                "description": "Marketplace for buying/selling (e.g., in-game, opensea)"
+            },
+            "asset_type": {
+                "type": "string",
+                "description": "Type of asset (e.g., character, weapon, land)"
+            },
+            "transfers": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "asset_id": {"type": "string"},
+                        "recipient_address": {"type": "string"},
+                        "quantity": {"type": "integer"}
+                    }
                 },
-                "marketplace": {
-                    "type": "string",
-                    "description": "Marketplace for buying/selling (e.g., in-game, opensea)"
+                "description": "Transfers to execute in one transaction for batch_transfer_asset"
+            },
+            "purchases": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "asset_id": {"type": "string"},
+                        "price": {"type": "number"},
+                        "quantity": {"type": "integer"}
+                    }
                 },
-                "asset_type": {
-                    "type": "string",
-                    "description": "Type of asset (e.g., character, weapon, land)"
-                }
+                "description": "Purchases to execute in one transaction for batch_buy_asset"
             },
-            "required": ["action"]
-        }
+            "partial": {
+                "type": "boolean",
+                "description": "Skip invalid batch entries instead of rejecting the whole batch (default: false)"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of items to return when listing assets, inventory, or marketplace"
+            },
+            "offset": {
+                "type": "integer",
+                "description": "Number of items to skip when paginating a listing (default: 0)"
+            }
+        },
+        "required": ["action"]
+    }
+    
+    # Action name -> (handler method, accepted keyword arguments)
+    _ACTION_DISPATCH = {
+        "list_assets": ("_list_assets", ("game_id", "asset_type", "limit", "offset")),
+        "get_asset_details": ("_get_asset_details", ("game_id", "asset_id")),
+        "transfer_asset": ("_transfer_asset", ("game_id", "asset_id", "recipient_address", "quantity")),
+        "list_games": ("_list_games", ()),
+        "get_inventory": ("_get_inventory", ("game_id", "wallet_address", "limit", "offset")),
+        "check_asset_value": ("_check_asset_value", ("game_id", "asset_id")),
+        "list_marketplace": ("_list_marketplace", ("game_id", "asset_type", "limit", "offset")),
+        "buy_asset": ("_buy_asset", ("game_id", "asset_id", "price", "quantity", "marketplace")),
+        "sell_asset": ("_sell_asset", ("game_id", "asset_id", "price", "quantity", "marketplace")),
+        "batch_transfer_asset": ("_batch_transfer_asset", ("game_id", "transfers", "partial")),
+        "batch_buy_asset": ("_batch_buy_asset", ("game_id", "purchases", "marketplace", "partial"))
+    }
+    
+    __slots__ = ("_marketplace_cache", "_tx_counter")
+    
+    # Native currency of each supported game
+    _GAME_CURRENCY = {
+        "axie-infinity": "AXS",
+        "gods-unchained": "GODS",
+        "star-atlas": "ATLAS",
+        "illuvium": "ILV",
+        "the-sandbox": "SAND"
+    }
+    
+    # Human-readable game names, e.g. "star-atlas" -> "Star Atlas"
+    _GAME_DISPLAY_NAME = {game_id: game_id.replace("-", " ").title() for game_id in _GAME_CURRENCY}
+    
+    # Names used in "missing argument" errors
+    _FIELD_LABELS = {
+        "game_id": "Game ID",
+        "asset_id": "asset ID",
+        "recipient_address": "recipient address",
+        "wallet_address": "wallet address",
+        "transfers": "transfers",
+        "purchases": "purchases"
+    }
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # game_id -> (asset-ID listing index, expiry timestamp) for per-listing lookups
+        self._marketplace_cache = {}
+        # Sequence number keeps IDs unique for same-second operations on the same asset
+        self._tx_counter = count(1)
     
     def execute(self, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """Execute the game asset manager tool with given parameters"""
         action = kwargs.get("action")
         
-        try:
-            if action == "list_assets":
-                return self._list_assets(
-                    game_id=kwargs.get("game_id"),
-                    asset_type=kwargs.get("asset_type")
-                )
-            elif action == "get_asset_details":
-                return self._get_asset_details(
-                    game_id=kwargs.get("game_id"),
-                    asset_id=kwargs.get("asset_id")
-                )
-            elif action == "transfer_asset":
-                return self._transfer_asset(
-                    game_id=kwargs.get("game_id"),
-                    asset_id=kwargs.get("asset_id"),
-                    recipient_address=kwargs.get("recipient_address"),
-                    quantity=kwargs.get("quantity", 1)
-                )
-            elif action == "list_games":
-                return self._list_games()
-            elif action == "get_inventory":
-                return self._get_inventory(
-                    game_id=kwargs.get("game_id"),
-                    wallet_address=kwargs.get("wallet_address")
-                )
-            elif action == "check_asset_value":
-                return self._check_asset_value(
-                    game_id=kwargs.get("game_id"),
-                    asset_id=kwargs.get("asset_id")
-                )
-            elif action == "list_marketplace":
-                return self._list_marketplace(
-                    game_id=kwargs.get("game_id"),
-                    asset_type=kwargs.get("asset_type")
-                )
-            elif action == "buy_asset":
-                return self._buy_asset(
-                    game_id=kwargs.get("game_id"),
-                    asset_id=kwargs.get("asset_id"),
-                    price=kwargs.get("price"),
-                    quantity=kwargs.get("quantity", 1),
-                    marketplace=kwargs.get("marketplace", "in-game")
-                )
-            elif action == "sell_asset":
-                return self._sell_asset(
-                    game_id=kwargs.get("game_id"),
-                    asset_id=kwargs.get("asset_id"),
-                    price=kwargs.get("price"),
-                    quantity=kwargs.get("quantity", 1),
-                    marketplace=kwargs.get("marketplace", "in-game")
-                )
-            else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Unknown game asset action: {action}"
-                )
-        except Exception as e:
-            logging.error(f"Error executing game asset action {action}: {e}")
+        spec = self._ACTION_DISPATCH.get(action)
+        if spec is None:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
-                error=f"Error executing game asset action {action}: {str(e)}"
+                error=f"Unknown game asset action: {action}"
             )
-    
-    def _list_assets(self, game_id: Optional[str] = None, 
-                   asset_type: Optional[str] = None) -> ToolResult:
-        """List available assets for a game"""
-        if not game_id:
+        
+        method_name, arg_names = spec
+        # Only forward supplied arguments so the handlers' own defaults apply
+        args = {key: kwargs[key] for key in arg_names if key in kwargs}
+        
+        try:
+            return getattr(self, method_name)(**args)
+        except Exception as e:
+            logger.error("Error executing game asset action %s: %s", action, e)
             return ToolResult(
                 tool_name=self.name,
                 status="error",
-                error="Game ID is required"
+                error=f"Error executing game asset action {action}: {str(e)}"
             )
+    
+    @classmethod
+    def warmup(cls) -> None:
+        """Pre-build the simulated assets of every supported game so first requests hit the cache"""
+        for game in _STATIC_GAMES:
+            _build_asset_index(game["id"])
+    
+    def serialize(self, result: Union[Dict[str, Any], ToolResult]) -> bytes:
+        """Encode an execute() result as JSON bytes, using orjson when it is installed"""
+        if isinstance(result, ToolResult):
+            result = result.to_dict()
+        return _dumps(result)
+    
+    async def async_execute(self, **kwargs) -> Union[Dict[str, Any], ToolResult]:
+        """Execute the tool in a worker thread so the event loop is not blocked"""
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
+    async def async_execute_many(self, actions: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], ToolResult]]:
+        """Execute independent actions concurrently, at most batch_size at a time"""
+        semaphore = asyncio.Semaphore(self.config.get("batch_size", _DEFAULT_BATCH_SIZE))
+        
+        async def run(action_kwargs: Dict[str, Any]) -> Union[Dict[str, Any], ToolResult]:
+            async with semaphore:
+                return await self.async_execute(**action_kwargs)
+        
+        return await asyncio.gather(*(run(action_kwargs) for action_kwargs in actions))
+    
+    def _require(self, **fields) -> Optional[ToolResult]:
+        """Return an error result naming the required fields if any of them is missing"""
+        if all(fields.values()):
+            return None
+        
+        labels = [self._FIELD_LABELS.get(name, name) for name in fields]
+        if len(labels) == 1:
+            error = f"{labels[0]} is required"
+        elif len(labels) == 2:
+            error = f"{labels[0]} and {labels[1]} are required"
+        else:
+            error = f"{', '.join(labels[:-1])}, and {labels[-1]} are required"
+        
+        return ToolResult(
+            tool_name=self.name,
+            status="error",
+            error=error[0].upper() + error[1:]
+        )
+    
+    def _list_assets(self, game_id: Optional[str] = None, asset_type: Optional[str] = None,
+                   limit: Optional[int] = None, offset: int = 0) -> ToolResult:
+        """List available assets for a game, optionally one page at a time"""
+        error = self._require(game_id=game_id)
+        if error:
+            return error
         
         # Simulated asset data - in a real implementation, this would query a game API
-        assets = self._simulate_game_assets(game_id, asset_type)
+        assets = self._get_game_assets(game_id, asset_type)
+        
+        # Only serialize the requested page
+        offset = max(offset or 0, 0)
+        page_end = None if limit is None else offset + max(limit, 0)
+        page = [asset.to_dict() for asset in islice(assets, offset, page_end)]
         
         return ToolResult.success(
             tool_name=self.name,
             result={
                 "game_id": game_id,
                 "asset_type": asset_type,
-                "assets": assets,
-                "count": len(assets)
+                "assets": page,
+                "count": len(assets),
+                **_page_info(len(assets), offset, len(page))
             }
         )
     
-    def _get_asset_details(self, game_id: str, asset_id: str) -> ToolResult:
+    def _get_asset_details(self, game_id: Optional[str] = None, asset_id: Optional[str] = None) -> ToolResult:
         """Get detailed information about a specific game asset"""
-        if not game_id or not asset_id:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Game ID and asset ID are required"
-            )
+        error = self._require(game_id=game_id, asset_id=asset_id)
+        if error:
+            return error
         
         # Simulated asset details
         asset_details = self._simulate_asset_details(game_id, asset_id)
@@ -177,8 +505,8 @@ class GameAssetManager(GameFiBaseTool):
             result=asset_details
         )
     
-    def _transfer_asset(self, game_id: str, asset_id: str, 
-                      recipient_address: str, quantity: int = 1) -> ToolResult:
+    def _transfer_asset(self, game_id: Optional[str] = None, asset_id: Optional[str] = None, 
+                      recipient_address: Optional[str] = None, quantity: int = 1) -> ToolResult:
         """Transfer an asset to another wallet"""
         if not self._wallet_address:
             return ToolResult(
@@ -187,89 +515,49 @@ class GameAssetManager(GameFiBaseTool):
                 error="Wallet not loaded. Please load a wallet first."
             )
         
-        if not game_id or not asset_id or not recipient_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Game ID, asset ID, and recipient address are required"
-            )
+        error = self._require(game_id=game_id, asset_id=asset_id, recipient_address=recipient_address)
+        if error:
+            return error
         
         # Check if user owns the asset and has enough quantity
-        inventory = self._simulate_inventory(game_id, self._wallet_address)
-        owned_assets = [asset for asset in inventory if asset["asset_id"] == asset_id]
+        owned_entry = self._get_inventory_index(game_id, self._wallet_address).get(asset_id)
         
-        if not owned_assets:
+        if owned_entry is None:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
                 error=f"You don't own any asset with ID {asset_id}"
             )
         
-        owned_asset = owned_assets[0]
-        if owned_asset["quantity"] < quantity:
+        if owned_entry.quantity < quantity:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
-                error=f"Insufficient quantity. You own {owned_asset['quantity']} but tried to transfer {quantity}."
+                error=f"Insufficient quantity. You own {owned_entry.quantity} but tried to transfer {quantity}."
             )
         
         # In a real implementation, this would execute the transfer on-chain
         # For simulation, we'll just return success
+        now = int(time.time())
         return ToolResult.success(
             tool_name=self.name,
             result={
-                "transaction_id": f"tx_{int(time.time())}_{asset_id[:6]}",
+                "transaction_id": self._make_id("tx", now, asset_id),
                 "sender": self._wallet_address,
                 "recipient": recipient_address,
                 "game_id": game_id,
                 "asset_id": asset_id,
-                "asset_name": owned_asset["name"],
+                "asset_name": owned_entry.asset.name,
                 "quantity": quantity,
                 "status": "completed",
-                "timestamp": int(time.time())
+                "timestamp": now
             }
         )
     
     def _list_games(self) -> ToolResult:
         """List supported blockchain games"""
         # Simulated list of supported games
-        games = [
-            {
-                "id": "axie-infinity",
-                "name": "Axie Infinity",
-                "blockchain": "ronin",
-                "website": "https://axieinfinity.com/",
-                "description": "Collect, battle, and earn with fantasy creatures called Axies"
-            },
-            {
-                "id": "gods-unchained",
-                "name": "Gods Unchained",
-                "blockchain": "ethereum",
-                "website": "https://godsunchained.com/",
-                "description": "Free-to-play tactical card game that gives players true ownership of their in-game items"
-            },
-            {
-                "id": "star-atlas",
-                "name": "Star Atlas",
-                "blockchain": "solana",
-                "website": "https://staratlas.com/",
-                "description": "Next-gen metaverse with AAA-quality game experience built on Solana"
-            },
-            {
-                "id": "illuvium",
-                "name": "Illuvium",
-                "blockchain": "ethereum",
-                "website": "https://illuvium.io/",
-                "description": "Auto-battler RPG with a vast open world to explore"
-            },
-            {
-                "id": "the-sandbox",
-                "name": "The Sandbox",
-                "blockchain": "ethereum",
-                "website": "https://www.sandbox.game/",
-                "description": "Virtual world where players can build, own, and monetize their gaming experiences"
-            }
-        ]
+        games = list(_STATIC_GAMES)
         
         return ToolResult.success(
             tool_name=self.name,
@@ -279,29 +567,33 @@ class GameAssetManager(GameFiBaseTool):
             }
         )
     
-    def _get_inventory(self, game_id: str, wallet_address: Optional[str] = None) -> ToolResult:
-        """Get inventory of in-game assets for a wallet"""
-        if not game_id:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Game ID is required"
-            )
+    def _get_inventory(self, game_id: Optional[str] = None, wallet_address: Optional[str] = None,
+                      limit: Optional[int] = None, offset: int = 0) -> ToolResult:
+        """Get inventory of in-game assets for a wallet, optionally one page at a time"""
+        error = self._require(game_id=game_id)
+        if error:
+            return error
         
         # Use provided wallet address or default to loaded wallet
         wallet = wallet_address or self._wallet_address
-        if not wallet:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Wallet address is required"
-            )
+        error = self._require(wallet_address=wallet)
+        if error:
+            return error
         
-        # Simulated inventory data
-        inventory = self._simulate_inventory(game_id, wallet)
+        offset = max(offset or 0, 0)
+        page_end = None if limit is None else offset + max(limit, 0)
         
-        # Calculate total value of inventory
-        total_value = sum(asset.get("value", 0) * asset.get("quantity", 1) for asset in inventory)
+        # Stream the simulated inventory, aggregating every asset but keeping only the requested page
+        inventory = []
+        asset_count = 0
+        total_items = 0
+        total_value = 0
+        for entry in self._iter_inventory(game_id, wallet):
+            total_items += entry.quantity
+            total_value += entry.value * entry.quantity
+            if asset_count >= offset and (page_end is None or asset_count < page_end):
+                inventory.append(entry.to_dict())
+            asset_count += 1
         
         return ToolResult.success(
             tool_name=self.name,
@@ -309,21 +601,19 @@ class GameAssetManager(GameFiBaseTool):
                 "game_id": game_id,
                 "wallet_address": wallet,
                 "inventory": inventory,
-                "asset_count": len(inventory),
-                "total_items": sum(asset.get("quantity", 1) for asset in inventory),
+                "asset_count": asset_count,
+                "total_items": total_items,
                 "total_value": total_value,
-                "currency": self._get_game_currency(game_id)
+                "currency": self._get_game_currency(game_id),
+                **_page_info(asset_count, offset, len(inventory))
             }
         )
     
-    def _check_asset_value(self, game_id: str, asset_id: str) -> ToolResult:
+    def _check_asset_value(self, game_id: Optional[str] = None, asset_id: Optional[str] = None) -> ToolResult:
         """Check the current market value of an asset"""
-        if not game_id or not asset_id:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Game ID and asset ID are required"
-            )
+        error = self._require(game_id=game_id, asset_id=asset_id)
+        if error:
+            return error
         
         # Simulated asset value data
         value_data = self._simulate_asset_value(game_id, asset_id)
@@ -340,31 +630,34 @@ class GameAssetManager(GameFiBaseTool):
             result=value_data
         )
     
-    def _list_marketplace(self, game_id: str, asset_type: Optional[str] = None) -> ToolResult:
-        """List assets available on the marketplace"""
-        if not game_id:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Game ID is required"
-            )
+    def _list_marketplace(self, game_id: Optional[str] = None, asset_type: Optional[str] = None,
+                         limit: Optional[int] = None, offset: int = 0) -> ToolResult:
+        """List assets available on the marketplace, optionally one page at a time"""
+        error = self._require(game_id=game_id)
+        if error:
+            return error
         
         # Simulated marketplace listings
         listings = self._simulate_marketplace_listings(game_id, asset_type)
         
+        offset = max(offset or 0, 0)
+        page_end = None if limit is None else offset + max(limit, 0)
+        page = listings[offset:page_end]
+        
         return ToolResult.success(
             tool_name=self.name,
             result={
                 "game_id": game_id,
                 "asset_type": asset_type,
-                "listings": listings,
+                "listings": page,
                 "count": len(listings),
-                "currency": self._get_game_currency(game_id)
+                "currency": self._get_game_currency(game_id),
+                **_page_info(len(listings), offset, len(page))
             }
         )
     
-    def _buy_asset(self, game_id: str, asset_id: str, price: float,
-                 quantity: int = 1, marketplace: str = "in-game") -> ToolResult:
+    def _buy_asset(self, game_id: Optional[str] = None, asset_id: Optional[str] = None, 
+                 price: Optional[float] = None, quantity: int = 1, marketplace: str = "in-game") -> ToolResult:
         """Buy an asset from the marketplace"""
         if not self._wallet_address:
             return ToolResult(
@@ -373,12 +666,9 @@ class GameAssetManager(GameFiBaseTool):
                 error="Wallet not loaded. Please load a wallet first."
             )
         
-        if not game_id or not asset_id:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Game ID and asset ID are required"
-            )
+        error = self._require(game_id=game_id, asset_id=asset_id)
+        if error:
+            return error
         
         if price is None:
             return ToolResult(
@@ -388,17 +678,15 @@ class GameAssetManager(GameFiBaseTool):
             )
         
         # Check if asset is available on marketplace
-        listings = self._simulate_marketplace_listings(game_id, None)
-        matching_listings = [listing for listing in listings if listing["asset_id"] == asset_id]
+        listing = self._get_listing_index(game_id).get(asset_id)
         
-        if not matching_listings:
+        if listing is None:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
                 error=f"Asset with ID {asset_id} not found on the marketplace"
             )
         
-        listing = matching_listings[0]
         if listing["price"] != price:
             return ToolResult(
                 tool_name=self.name,
@@ -415,10 +703,11 @@ class GameAssetManager(GameFiBaseTool):
         
         # In a real implementation, this would execute the purchase on-chain
         # For simulation, we'll just return success
+        now = int(time.time())
         return ToolResult.success(
             tool_name=self.name,
             result={
-                "transaction_id": f"tx_{int(time.time())}_{asset_id[:6]}",
+                "transaction_id": self._make_id("tx", now, asset_id),
                 "buyer": self._wallet_address,
                 "seller": listing["seller"],
                 "game_id": game_id,
@@ -430,13 +719,14 @@ class GameAssetManager(GameFiBaseTool):
                 "currency": self._get_game_currency(game_id),
                 "marketplace": marketplace,
                 "status": "completed",
-                "timestamp": int(time.time())
+                "timestamp": now
             }
         )
     
-    def _sell_asset(self, game_id: str, asset_id: str, price: float,
-                  quantity: int = 1, marketplace: str = "in-game") -> ToolResult:
-        """List an asset for sale on the marketplace"""
+    def _batch_transfer_asset(self, game_id: Optional[str] = None,
+                             transfers: Optional[List[Dict[str, Any]]] = None,
+                             partial: bool = False) -> ToolResult:
+        """Transfer several assets in a single transaction"""
         if not self._wallet_address:
             return ToolResult(
                 tool_name=self.name,
@@ -444,13 +734,178 @@ class GameAssetManager(GameFiBaseTool):
                 error="Wallet not loaded. Please load a wallet first."
             )
         
-        if not game_id or not asset_id:
+        error = self._require(game_id=game_id, transfers=transfers)
+        if error:
+            return error
+        
+        # Validate every entry against one inventory snapshot, tracking quantities
+        # already claimed by earlier entries for the same asset
+        inventory_index = self._get_inventory_index(game_id, self._wallet_address)
+        remaining = {}
+        accepted = []
+        rejected = []
+        for position, transfer in enumerate(transfers):
+            asset_id = transfer.get("asset_id")
+            recipient_address = transfer.get("recipient_address")
+            quantity = transfer.get("quantity", 1)
+            owned_entry = inventory_index.get(asset_id)
+            
+            if not asset_id or not recipient_address:
+                reason = "Asset ID and recipient address are required"
+            elif isinstance(quantity, bool) or not isinstance(quantity, int) or quantity < 1:
+                reason = f"Quantity must be a positive integer, got {quantity!r}"
+            elif owned_entry is None:
+                reason = f"You don't own any asset with ID {asset_id}"
+            elif remaining.setdefault(asset_id, owned_entry.quantity) < quantity:
+                reason = f"Insufficient quantity. {remaining[asset_id]} left but tried to transfer {quantity}."
+            else:
+                remaining[asset_id] -= quantity
+                accepted.append({
+                    "asset_id": asset_id,
+                    "asset_name": owned_entry.asset.name,
+                    "recipient": recipient_address,
+                    "quantity": quantity
+                })
+                continue
+            
+            rejected.append({"index": position, "asset_id": asset_id, "error": reason})
+        
+        if rejected and not partial:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Batch transfer rejected: {len(rejected)} of {len(transfers)} transfers are invalid",
+                metadata={"rejected": rejected}
+            )
+        
+        if not accepted:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error="No valid transfers in batch",
+                metadata={"rejected": rejected}
+            )
+        
+        # In a real implementation, all transfers would be submitted as one on-chain
+        # batch transaction; for simulation, we'll just return success
+        now = int(time.time())
+        return ToolResult.success(
+            tool_name=self.name,
+            result={
+                "transaction_id": self._make_id("tx", now, game_id),
+                "sender": self._wallet_address,
+                "game_id": game_id,
+                "transfers": accepted,
+                "transfer_count": len(accepted),
+                "skipped": rejected,
+                "status": "completed",
+                "timestamp": now
+            }
+        )
+    
+    def _batch_buy_asset(self, game_id: Optional[str] = None,
+                        purchases: Optional[List[Dict[str, Any]]] = None,
+                        marketplace: str = "in-game", partial: bool = False) -> ToolResult:
+        """Buy several assets from the marketplace in a single transaction"""
+        if not self._wallet_address:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error="Wallet not loaded. Please load a wallet first."
+            )
+        
+        error = self._require(game_id=game_id, purchases=purchases)
+        if error:
+            return error
+        
+        # Validate every entry against one marketplace snapshot, tracking quantities
+        # already claimed by earlier entries for the same listing
+        listing_index = self._get_listing_index(game_id)
+        remaining = {}
+        accepted = []
+        rejected = []
+        total_price = 0
+        for position, purchase in enumerate(purchases):
+            asset_id = purchase.get("asset_id")
+            price = purchase.get("price")
+            quantity = purchase.get("quantity", 1)
+            listing = listing_index.get(asset_id)
+            
+            if not asset_id or price is None:
+                reason = "Asset ID and price are required"
+            elif isinstance(quantity, bool) or not isinstance(quantity, int) or quantity < 1:
+                reason = f"Quantity must be a positive integer, got {quantity!r}"
+            elif listing is None:
+                reason = f"Asset with ID {asset_id} not found on the marketplace"
+            elif listing["price"] != price:
+                reason = f"Price mismatch. Listed price is {listing['price']} but you offered {price}."
+            elif remaining.setdefault(asset_id, listing["quantity_available"]) < quantity:
+                reason = f"Insufficient quantity available. Only {remaining[asset_id]} left but you tried to buy {quantity}."
+            else:
+                remaining[asset_id] -= quantity
+                total_price += price * quantity
+                accepted.append({
+                    "asset_id": asset_id,
+                    "asset_name": listing["name"],
+                    "seller": listing["seller"],
+                    "quantity": quantity,
+                    "price_per_unit": price,
+                    "total_price": price * quantity
+                })
+                continue
+            
+            rejected.append({"index": position, "asset_id": asset_id, "error": reason})
+        
+        if rejected and not partial:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Batch purchase rejected: {len(rejected)} of {len(purchases)} purchases are invalid",
+                metadata={"rejected": rejected}
+            )
+        
+        if not accepted:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error="No valid purchases in batch",
+                metadata={"rejected": rejected}
+            )
+        
+        # In a real implementation, all purchases would be settled in one on-chain
+        # batch transaction; for simulation, we'll just return success
+        now = int(time.time())
+        return ToolResult.success(
+            tool_name=self.name,
+            result={
+                "transaction_id": self._make_id("tx", now, game_id),
+                "buyer": self._wallet_address,
+                "game_id": game_id,
+                "purchases": accepted,
+                "purchase_count": len(accepted),
+                "skipped": rejected,
+                "total_price": total_price,
+                "currency": self._get_game_currency(game_id),
+                "marketplace": marketplace,
+                "status": "completed",
+                "timestamp": now
+            }
+        )
+    
+    def _sell_asset(self, game_id: Optional[str] = None, asset_id: Optional[str] = None, 
+                  price: Optional[float] = None, quantity: int = 1, marketplace: str = "in-game") -> ToolResult:
+        """List an asset for sale on the marketplace"""
+        if not self._wallet_address:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
-                error="Game ID and asset ID are required"
+                error="Wallet not loaded. Please load a wallet first."
             )
         
+        error = self._require(game_id=game_id, asset_id=asset_id)
+        if error:
+            return error
+        
         if price is None:
             return ToolResult(
                 tool_name=self.name,
@@ -459,173 +914,111 @@ class GameAssetManager(GameFiBaseTool):
             )
         
         # Check if user owns the asset and has enough quantity
-        inventory = self._simulate_inventory(game_id, self._wallet_address)
-        owned_assets = [asset for asset in inventory if asset["asset_id"] == asset_id]
+        owned_entry = self._get_inventory_index(game_id, self._wallet_address).get(asset_id)
         
-        if not owned_assets:
+        if owned_entry is None:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
                 error=f"You don't own any asset with ID {asset_id}"
             )
         
-        owned_asset = owned_assets[0]
-        if owned_asset["quantity"] < quantity:
+        if owned_entry.quantity < quantity:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
-                error=f"Insufficient quantity. You own {owned_asset['quantity']} but tried to sell {quantity}."
+                error=f"Insufficient quantity. You own {owned_entry.quantity} but tried to sell {quantity}."
             )
         
         # In a real implementation, this would list the asset on-chain or in a marketplace
         # For simulation, we'll just return success
+        now = int(time.time())
         return ToolResult.success(
             tool_name=self.name,
             result={
-                "listing_id": f"list_{int(time.time())}_{asset_id[:6]}",
+                "listing_id": self._make_id("list", now, asset_id),
                 "seller": self._wallet_address,
                 "game_id": game_id,
                 "asset_id": asset_id,
-                "asset_name": owned_asset["name"],
+                "asset_name": owned_entry.asset.name,
                 "quantity": quantity,
                 "price_per_unit": price,
                 "total_price": price * quantity,
                 "currency": self._get_game_currency(game_id),
                 "marketplace": marketplace,
                 "status": "listed",
-                "expiration": int(time.time()) + 7 * 24 * 60 * 60  # 7 days
+                "expiration": now + _LISTING_TTL_SECONDS
             }
         )
     
+    def _make_id(self, prefix: str, now: int, asset_id: str) -> str:
+        """Build a unique transaction or listing ID"""
+        return f"{prefix}_{now}_{next(self._tx_counter):06x}_{asset_id[:6]}"
+    
+    def _get_game_currency(self, game_id: str) -> str:
+        """Get the currency used by a game's marketplace"""
+        return self._GAME_CURRENCY.get(game_id, "USD")
+    
+    def _cached_index(self, cache: Dict[str, Any], game_id: str, build_index) -> Dict[str, Any]:
+        """Return the asset-ID index for a game, rebuilding it from a full fetch once it expires"""
+        now = time.time()
+        entry = cache.get(game_id)
+        if entry is None or entry[1] <= now:
+            # One full fetch per game serves every per-asset lookup until expiry;
+            # a real backend would issue a single batched request here
+            entry = (build_index(game_id), now + _LOOKUP_CACHE_TTL)
+            cache[game_id] = entry
+        return entry[0]
+    
+    def _get_asset_index(self, game_id: str) -> Dict[str, GameAsset]:
+        """Get the shared asset-ID index of all assets for a game; callers must not modify it"""
+        return _build_asset_index(game_id)
+    
+    def _get_listing_index(self, game_id: str) -> Dict[str, Dict[str, Any]]:
+        """Get the cached asset-ID index of all marketplace listings for a game"""
+        return self._cached_index(
+            self._marketplace_cache, game_id,
+            lambda gid: _index_by_asset_id(self._simulate_marketplace_listings(gid, None))
+        )
+    
+    def _get_game_assets(self, game_id: str, asset_type: Optional[str] = None) -> List[GameAsset]:
+        """Get the shared simulated assets for a game"""
+        return list(_build_game_assets(game_id, asset_type))
+    
     def _simulate_game_assets(self, game_id: str, asset_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Simulate a list of assets for a game"""
-        # Asset templates by game
-        asset_templates = {
-            "axie-infinity": [
-                {"type": "character", "rarity": "rare", "class": "aquatic"},
-                {"type": "character", "rarity": "epic", "class": "beast"},
-                {"type": "character", "rarity": "common", "class": "plant"},
-                {"type": "land", "rarity": "common", "region": "savannah"},
-                {"type": "item", "rarity": "epic", "category": "potion"}
-            ],
-            "gods-unchained": [
-                {"type": "card", "rarity": "rare", "god": "nature"},
-                {"type": "card", "rarity": "epic", "god": "death"},
-                {"type": "card", "rarity": "legendary", "god": "light"},
-                {"type": "card", "rarity": "common", "god": "war"},
-                {"type": "cosmetic", "rarity": "epic", "category": "board"}
-            ],
-            "star-atlas": [
-                {"type": "ship", "rarity": "rare", "faction": "oni"},
-                {"type": "ship", "rarity": "epic", "faction": "mud"},
-                {"type": "land", "rarity": "legendary", "region": "nebula"},
-                {"type": "equipment", "rarity": "common", "category": "weapon"},
-                {"type": "crew", "rarity": "rare", "role": "engineer"}
-            ]
-        }
-        
-        # Generic assets if game not found
-        if game_id not in asset_templates:
-            asset_templates[game_id] = [
-                {"type": "character", "rarity": "common", "class": "warrior"},
-                {"type": "weapon", "rarity": "rare", "category": "sword"},
-                {"type": "armor", "rarity": "epic", "category": "helmet"},
-                {"type": "consumable", "rarity": "common", "category": "potion"},
-                {"type": "resource", "rarity": "common", "category": "wood"}
-            ]
-        
-        templates = asset_templates[game_id]
-        
-        # Filter by asset type if specified
-        if asset_type:
-            templates = [t for t in templates if t["type"] == asset_type]
-        
-        # Generate assets from templates
-        assets = []
-        for i, template in enumerate(templates):
-            asset_type = template["type"]
-            rarity = template["rarity"]
-            
-            # Base properties
-            asset = {
-                "asset_id": f"{game_id}-{asset_type}-{i+1}",
-                "name": f"{rarity.capitalize()} {asset_type.capitalize()} #{i+1}",
-                "type": asset_type,
-                "rarity": rarity,
-                "game_id": game_id,
-                "transferable": True,
-                "metadata_uri": f"https://example.com/games/{game_id}/assets/{asset_type}-{i+1}"
-            }
-            
-            # Add template-specific properties
-            for key, value in template.items():
-                if key not in ["type", "rarity"]:
-                    asset[key] = value
-            
-            # Add generic stats
-            stats = {}
-            if asset_type in ["character", "ship", "card"]:
-                stats["attack"] = 5 + (i * 2)
-                stats["defense"] = 3 + i
-                stats["health"] = 10 + (i * 3)
-            elif asset_type in ["weapon", "equipment"]:
-                stats["damage"] = 3 + (i * 2)
-                stats["durability"] = 20 + (i * 5)
-            elif asset_type == "land":
-                stats["size"] = 10 + (i * 5)
-                stats["resources"] = 2 + i
-            
-            if stats:
-                asset["stats"] = stats
-            
-            assets.append(asset)
-        
-        return assets
+        return [asset.to_dict() for asset in _build_game_assets(game_id, asset_type)]
     
     def _simulate_asset_details(self, game_id: str, asset_id: str) -> Optional[Dict[str, Any]]:
         """Simulate detailed information for a specific asset"""
-        # Get all assets for the game
-        all_assets = self._simulate_game_assets(game_id, None)
-        
-        # Find the specific asset
-        matching_assets = [asset for asset in all_assets if asset["asset_id"] == asset_id]
-        if not matching_assets:
+        # Find the specific asset among all assets for the game
+        asset = self._get_asset_index(game_id).get(asset_id)
+        if asset is None:
             return None
         
-        asset = matching_assets[0]
-        
         # Add more detailed information
-        asset_details = asset.copy()
+        asset_details = asset.to_dict()
         
         # Add description
-        asset_details["description"] = f"A {asset['rarity']} {asset['type']} from the game {game_id.replace('-', ' ').title()}."
+        game_name = self._GAME_DISPLAY_NAME.get(game_id) or game_id.replace("-", " ").title()
+        asset_details["description"] = f"A {asset.rarity} {asset.type} from the game {game_name}."
         
         # Add value
-        rarity_multiplier = {
-            "common": 1,
-            "uncommon": 2,
-            "rare": 5,
-            "epic": 10,
-            "legendary": 25,
-            "mythic": 100
-        }
-        base_value = 10
-        multiplier = rarity_multiplier.get(asset["rarity"], 1)
-        asset_details["value"] = base_value * multiplier
+        asset_details["value"] = _RARITY_VALUE.get(asset.rarity, _BASE_ASSET_VALUE)
         
         # Add attributes/traits
         attributes = []
-        for key, value in asset.items():
-            if key not in ["asset_id", "name", "type", "rarity", "game_id", "transferable", "metadata_uri", "stats"]:
-                attributes.append({
-                    "trait_type": key,
-                    "value": value
-                })
+        for key, value in asset.extra.items():
+            attributes.append({
+                "trait_type": key,
+                "value": value
+            })
         
         # Add some random attributes
-        if asset["type"] == "character":
-            attributes.append({"trait_type": "level", "value": 1 + (hash(asset_id) % 100)})
-            attributes.append({"trait_type": "experience", "value": 0 + (hash(asset_id) % 1000)})
+        if asset.type == "character":
+            asset_hash = _stable_hash(asset_id)
+            attributes.append({"trait_type": "level", "value": 1 + (asset_hash % 100)})
+            attributes.append({"trait_type": "experience", "value": asset_hash % 1000})
         
         asset_details["attributes"] = attributes
         
@@ -637,37 +1030,33 @@ class GameAssetManager(GameFiBaseTool):
     
     def _simulate_inventory(self, game_id: str, wallet_address: str) -> List[Dict[str, Any]]:
         """Simulate inventory for a wallet"""
+        return [entry.to_dict() for entry in self._iter_inventory(game_id, wallet_address)]
+    
+    def _get_inventory_index(self, game_id: str, wallet_address: str) -> Dict[str, InventoryEntry]:
+        """Index a wallet's simulated inventory by asset ID, keeping the first entry for duplicates"""
+        index = {}
+        for entry in self._iter_inventory(game_id, wallet_address):
+            index.setdefault(entry.asset.asset_id, entry)
+        return index
+    
+    def _iter_inventory(self, game_id: str, wallet_address: str) -> Iterator[InventoryEntry]:
+        """Simulate inventory for a wallet, yielding one entry at a time"""
         # Get all assets for the game
-        all_assets = self._simulate_game_assets(game_id, None)
+        all_assets = self._get_game_assets(game_id, None)
         
         # Deterministically select some assets based on wallet address
-        wallet_hash = hash(wallet_address)
+        wallet_hash = _stable_hash(wallet_address)
         asset_count = (wallet_hash % 8) + 2  # 2-9 assets
         
-        inventory = []
         for i in range(min(asset_count, len(all_assets))):
-            asset_index = (wallet_hash + i) % len(all_assets)
-            asset = all_assets[asset_index].copy()
-            
-            # Add quantity and acquisition information
-            asset["quantity"] = ((wallet_hash + i) % 5) + 1
-            asset["acquisition_date"] = "2023-06-15T12:34:56Z"
-            
-            # Add value
-            rarity_multiplier = {
-                "common": 1,
-                "uncommon": 2,
-                "rare": 5,
-                "epic": 10,
-                "legendary": 25,
-                "mythic": 100
-            }
-            base_value = 10
-            multiplier = rarity_multiplier.get(asset["rarity"], 1)
-            asset["value"] = base_value * multiplier
+            asset = all_assets[(wallet_hash + i) % len(all_assets)]
             
-            inventory.append(asset)
-        
-        return inventory
+            # Reference the shared asset and add quantity, value and acquisition information
+            yield InventoryEntry(
+                asset=asset,
+                quantity=((wallet_hash + i) % 5) + 1,
+                value=_RARITY_VALUE.get(asset.rarity, _BASE_ASSET_VALUE),
+                acquisition_date="2023-06-15T12:34:56Z"
+            )
     
     def _simulate_asset_value(self, game_id: str,
\ No newline at end of file
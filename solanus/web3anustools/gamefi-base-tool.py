@@ -1,96 +1,194 @@
 from typing import Dict, Any, Optional, List, Union
-import json
+from collections import deque
+import asyncio
 import logging
-import requests
+import random
 import time
+from requests import HTTPError
 from anus.tools.base.tool import BaseTool
 from anus.tools.base.tool_result import ToolResult
+from anus.tools.web3.solana_client_mixin import SolanaClientMixin, _json_body, _json_loads
 
-class GameFiBaseTool(BaseTool):
+logger = logging.getLogger("anus.tools.web3.gamefi_base_tool")
+
+# Default per-game limits for async API requests
+_DEFAULT_MAX_RPS = 10
+_DEFAULT_MAX_CONCURRENT = 10
+
+# Retries of a rate-limited (HTTP 429) async API request, and the backoff they start from
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF = 0.5
+_MAX_RATE_LIMIT_DELAY = 60
+
+def _retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request, honoring rate-limit headers"""
+    backoff = _RATE_LIMIT_BACKOFF * 2 ** attempt
+    delay = backoff
+    for header in ("Retry-After", "X-RateLimit-Reset"):
+        try:
+            value = float(headers[header])
+        except (KeyError, ValueError):
+            continue
+        # X-RateLimit-Reset is an epoch timestamp on most APIs, a delay on some
+        if value > 1e9:
+            value -= time.time()
+        delay = max(delay, value)
+        break
+    # Random jitter keeps concurrent retries from hitting the API in lockstep
+    return min(delay + random.uniform(0, backoff), _MAX_RATE_LIMIT_DELAY)
+
+class RateLimiter:
+    """
+    Async limiter capping both requests per second and requests in flight.
+    Use as `async with limiter:` around each request.
+    """
+    
+    def __init__(self, max_rps: int = _DEFAULT_MAX_RPS, max_concurrent: int = _DEFAULT_MAX_CONCURRENT):
+        self.max_rps = max_rps
+        self.max_concurrent = max_concurrent
+        self._sent = deque()  # monotonic send times within the last second
+        self._resume_at = 0.0
+        self._semaphore = None
+        self._loop = None
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every request through this limiter for the given number of seconds"""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        semaphore = self._semaphore
+        
+        await semaphore.acquire()
+        try:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= 1:
+                    self._sent.popleft()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                elif len(self._sent) >= self.max_rps:
+                    await asyncio.sleep(1 - (now - self._sent[0]))
+                else:
+                    self._sent.append(now)
+                    return
+        except BaseException:
+            semaphore.release()
+            raise
+    
+    def release(self) -> None:
+        """Free the in-flight slot taken by acquire()"""
+        self._semaphore.release()
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+class GameFiBaseTool(SolanaClientMixin, BaseTool):
     """
     Base class for GameFi integration tools.
     Provides common functionality for blockchain gaming tools.
     """
     name = "gamefi_base"
     description = "Base class for GameFi tools. Not meant to be used directly."
+    _tool_family = "GameFi"
+    
+    __slots__ = ("game_api_keys", "_auth_headers", "_rate_limiters")
     
     def __init__(self, 
                  rpc_url: str = "https://api.mainnet-beta.solana.com",
                  private_key_path: Optional[str] = None,
                  game_api_keys: Optional[Dict[str, str]] = None,
                  **kwargs):
-        super().__init__(**kwargs)
-        self.rpc_url = rpc_url
-        self.private_key_path = private_key_path
         self.game_api_keys = game_api_keys or {}
-        self._client = None
-        self._keypair = None
-        self._wallet_address = None
-        
-        # Initialize blockchain client
-        self._initialize_client()
-        
-        # Load wallet if private key is provided
-        if private_key_path:
-            self._load_wallet()
-    
-    def _initialize_client(self):
-        """Initialize blockchain client"""
-        try:
-            # We're using dynamic imports to handle optional dependencies
-            from solana.rpc.api import Client
-            self._client = Client(self.rpc_url)
-            logging.info(f"Solana client initialized with RPC URL: {self.rpc_url}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for GameFi tools. Install with 'pip install solana'")
-    
-    def _load_wallet(self):
-        """Load wallet from private key file"""
-        try:
-            from solana.keypair import Keypair
-            
-            try:
-                with open(self.private_key_path, 'r') as f:
-                    private_key_json = json.load(f)
-                    private_key_bytes = bytes(private_key_json)
-                    self._keypair = Keypair.from_secret_key(private_key_bytes)
-                    self._wallet_address = str(self._keypair.public_key)
-                    logging.info(f"Wallet loaded with address: {self._wallet_address}")
-            except Exception as e:
-                logging.error(f"Error loading wallet: {e}")
-                raise ValueError(f"Failed to load wallet from {self.private_key_path}: {e}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for wallet functionality")
+        # Authorization header per game, built once instead of per request
+        self._auth_headers = {game_id: {"Authorization": f"Bearer {key}"} for game_id, key in self.game_api_keys.items()}
+        # game_id -> RateLimiter, so one game's API limits don't starve another's
+        self._rate_limiters = {}
+        super().__init__(rpc_url=rpc_url, private_key_path=private_key_path, **kwargs)
     
     def api_request(self, endpoint: str, method: str = "GET", params: Optional[Dict[str, Any]] = None, 
                  headers: Optional[Dict[str, str]] = None, game_id: Optional[str] = None) -> Dict[str, Any]:
         """Make a request to a game API"""
-        headers = headers or {}
-        
         # Add API key if available for the specified game
-        if game_id and game_id in self.game_api_keys:
-            headers["Authorization"] = f"Bearer {self.game_api_keys[game_id]}"
+        auth_headers = self._auth_headers.get(game_id)
+        if auth_headers:
+            headers = {**headers, **auth_headers} if headers else auth_headers
+        headers = headers or {}
         
         try:
             if method.upper() == "GET":
-                response = requests.get(endpoint, params=params, headers=headers, timeout=10)
+                response = self._http.get(endpoint, params=params, headers=headers, timeout=10)
             elif method.upper() == "POST":
-                response = requests.post(endpoint, json=params, headers=headers, timeout=10)
+                body, headers = _json_body(params, headers)
+                response = self._http.post(endpoint, data=body, headers=headers, timeout=10)
             else:
                 return {"error": f"Unsupported HTTP method: {method}"}
             
-            response.raise_for_status()
-            return response.json()
+            if response.status_code >= 400:
+                raise HTTPError(f"{response.status_code} Error: {response.reason} for url: {response.url}", response=response)
+            return _json_loads(response.content)
         except Exception as e:
-            logging.error(f"API request error for {endpoint}: {e}")
+            logger.error("API request error for %s: %s", endpoint, e)
             return {"error": str(e)}
     
+    async def async_api_request(self, endpoint: str, method: str = "GET", params: Optional[Dict[str, Any]] = None,
+                                headers: Optional[Dict[str, str]] = None, game_id: Optional[str] = None) -> Dict[str, Any]:
+        """Make a non-blocking request to a game API, so many requests can run concurrently"""
+        # Add API key if available for the specified game
+        auth_headers = self._auth_headers.get(game_id)
+        if auth_headers:
+            headers = {**headers, **auth_headers} if headers else auth_headers
+        headers = headers or {}
+        
+        verb = method.upper()
+        if verb not in ("GET", "POST"):
+            return {"error": f"Unsupported HTTP method: {method}"}
+        
+        limiter = self._get_rate_limiter(game_id)
+        try:
+            session = await self._get_session()
+            for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                async with limiter:
+                    if verb == "GET":
+                        request = session.get(endpoint, params=params, headers=headers)
+                    else:
+                        body, post_headers = _json_body(params, headers)
+                        request = session.post(endpoint, data=body, headers=post_headers)
+                    
+                    async with request as response:
+                        if response.status == 429 and attempt < _RATE_LIMIT_RETRIES:
+                            # Throttle every request for this game, not just the retry
+                            limiter.pause(_retry_delay(response.headers, attempt))
+                            continue
+                        response.raise_for_status()
+                        return _json_loads(await response.read())
+        except Exception as e:
+            logger.error("API request error for %s: %s", endpoint, e)
+            return {"error": str(e)}
+    
+    def _get_rate_limiter(self, game_id: Optional[str]) -> RateLimiter:
+        """Get the async request limiter for a game, creating it on first use"""
+        limiter = self._rate_limiters.get(game_id)
+        if limiter is None:
+            limiter = RateLimiter(
+                max_rps=self.config.get("max_rps", _DEFAULT_MAX_RPS),
+                max_concurrent=self.config.get("max_concurrent_requests", _DEFAULT_MAX_CONCURRENT)
+            )
+            self._rate_limiters[game_id] = limiter
+        return limiter
+    
     def _simulate_game_api_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate a game API response for demonstration purposes"""
         return {
             "success": True,
-            "timestamp": int(time.time()),
+            "timestamp": time.time_ns() // 1_000_000_000,
             "data": data
         }
@@ -1,132 +1,322 @@
-from typing import Dict, Any, Optional, List, Union
-import json
+from typing import Dict, Any, AsyncIterator, Optional, List, Union
+from functools import lru_cache
+import asyncio
+import copy
 import logging
+import os
+import re
 import time
+from requests import HTTPError
 from anus.tools.base.tool import BaseTool
 from anus.tools.base.tool_result import ToolResult
+from anus.tools.web3.solana_client_mixin import SolanaClientMixin, _json_loads
 
-class NFTBaseTool(BaseTool):
+logger = logging.getLogger("anus.tools.web3.nft_base_tool")
+
+# Fetched JSON is cached per resolved URL for this many seconds, up to _JSON_CACHE_MAXSIZE URLs
+_JSON_CACHE_TTL = 3600
+_JSON_CACHE_MAXSIZE = 10_000
+
+# Public IPFS gateways raced against the configured gateway when no explicit list is given
+_FALLBACK_IPFS_GATEWAYS = ("https://ipfs.io/ipfs/", "https://cloudflare-ipfs.com/ipfs/", "https://nftstorage.link/ipfs/")
+
+# Default number of metadata fetches fetch_metadata_many runs at once
+_METADATA_FETCH_CONCURRENCY = 32
+
+# Default cap on hedged metadata fetches running at once
+_MAX_HEDGED_REQUESTS = 16
+
+# Storage protocol prefixes: "<scheme>://", "<scheme>/" or "<scheme>:"
+_STORAGE_PREFIX_RE = re.compile(r"(?:(?P<ipfs>ipfs)|ar)(?:://|/|:)")
+
+# IPFS content identifier (CIDv0 or CIDv1) as a URL path segment; such content is immutable
+_IPFS_CID_RE = re.compile(r"/(?:Qm[1-9A-HJ-NP-Za-km-z]{44}|bafy[a-z2-7]{55,})(?:[/?#]|$)")
+
+# A bare CIDv0 or CIDv1, with no protocol prefix or path
+_CID_RE = re.compile(r"^(Qm[1-9A-HJ-NP-Za-km-z]{44}|bafy[a-z2-7]{55,})$")
+
+@lru_cache(maxsize=100_000)
+def _resolve_storage_uri(uri: str, ipfs_gateway: Optional[str], arweave_gateway: Optional[str]) -> str:
+    """Resolve an IPFS or Arweave URI to an HTTP URL; schemes without a gateway are left unchanged"""
+    if not uri:
+        return ""
+    
+    # One scan picks the protocol and where the content hash starts
+    match = _STORAGE_PREFIX_RE.match(uri)
+    if match is None and ipfs_gateway and _CID_RE.match(uri):
+        # A raw CID is IPFS content without the prefix
+        return f"{ipfs_gateway}{uri}"
+    gateway = match and (ipfs_gateway if match.group("ipfs") else arweave_gateway)
+    if not gateway:
+        # Already HTTP URL or other protocol
+        return uri
+    return f"{gateway}{uri[match.end():]}"
+
+def _bare_cid(uri: str) -> Optional[str]:
+    """Return the CID if a URI names a whole IPFS object (a raw CID or "ipfs://<CID>"), else None"""
+    match = _STORAGE_PREFIX_RE.match(uri)
+    if match is not None:
+        if not match.group("ipfs"):
+            return None
+        uri = uri[match.end():]
+    return uri if _CID_RE.match(uri) else None
+
+def _iter_prefix(document: Any, prefix: str) -> List[Any]:
+    """Collect the values at an ijson-style prefix ("a.item.b") from a parsed JSON document"""
+    nodes = [document]
+    for key in prefix.split(".") if prefix else ():
+        matched = []
+        for node in nodes:
+            if key == "item" and isinstance(node, list):
+                matched.extend(node)
+            elif isinstance(node, dict) and key in node:
+                matched.append(node[key])
+        nodes = matched
+    return nodes
+
+class NFTBaseTool(SolanaClientMixin, BaseTool):
     """
     Base class for NFT-related tools.
     Provides common functionality for NFT tools.
     """
     name = "nft_base"
     description = "Base class for NFT tools. Not meant to be used directly."
+    _tool_family = "NFT"
+    
+    # Resolved URL -> (JSON data, expiry timestamp), shared by all NFT tools
+    _json_cache = {}
     
     def __init__(self, 
                  rpc_url: str = "https://api.mainnet-beta.solana.com",
                  private_key_path: Optional[str] = None,
                  ipfs_gateway: str = "https://ipfs.io/ipfs/",
                  arweave_gateway: str = "https://arweave.net/",
+                 ipfs_gateways: Optional[List[str]] = None,
+                 local_ipfs: Optional[str] = None,
                  **kwargs):
-        super().__init__(**kwargs)
-        self.rpc_url = rpc_url
-        self.private_key_path = private_key_path
         self.ipfs_gateway = ipfs_gateway
         self.arweave_gateway = arweave_gateway
-        self._client = None
-        self._keypair = None
-        self._wallet_address = None
-        
-        # Initialize blockchain client
-        self._initialize_client()
-        
-        # Load wallet if private key is provided
-        if private_key_path:
-            self._load_wallet()
-    
-    def _initialize_client(self):
-        """Initialize blockchain client"""
-        try:
-            # We're using dynamic imports to handle optional dependencies
-            from solana.rpc.api import Client
-            self._client = Client(self.rpc_url)
-            logging.info(f"Solana client initialized with RPC URL: {self.rpc_url}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for NFT tools. Install with 'pip install solana'")
-    
-    def _load_wallet(self):
-        """Load wallet from private key file"""
-        try:
-            from solana.keypair import Keypair
-            
-            try:
-                with open(self.private_key_path, 'r') as f:
-                    private_key_json = json.load(f)
-                    private_key_bytes = bytes(private_key_json)
-                    self._keypair = Keypair.from_secret_key(private_key_bytes)
-                    self._wallet_address = str(self._keypair.public_key)
-                    logging.info(f"Wallet loaded with address: {self._wallet_address}")
-            except Exception as e:
-                logging.error(f"Error loading wallet: {e}")
-                raise ValueError(f"Failed to load wallet from {self.private_key_path}: {e}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for wallet functionality")
+        # Gateways raced by async_fetch_metadata; the first two are queried for each IPFS fetch
+        self.ipfs_gateways = ipfs_gateways or [ipfs_gateway, *(g for g in _FALLBACK_IPFS_GATEWAYS if g != ipfs_gateway)]
+        # Resolved URL -> future of the async fetch currently running for it
+        self._inflight = {}
+        self._active_hedges = 0
+        # HTTP API of a local IPFS node (e.g. "http://127.0.0.1:5001"), tried before any gateway
+        local_ipfs = local_ipfs or os.environ.get("IPFS_API")
+        self.local_ipfs = local_ipfs.rstrip("/") if local_ipfs else None
+        super().__init__(rpc_url=rpc_url, private_key_path=private_key_path, **kwargs)
     
     def resolve_ipfs_url(self, ipfs_uri: str) -> str:
         """Convert IPFS URI to HTTP URL using configured gateway"""
-        if not ipfs_uri:
-            return ""
-            
-        # Handle various IPFS URI formats
-        if ipfs_uri.startswith("ipfs://"):
-            ipfs_hash = ipfs_uri[7:]
-            return f"{self.ipfs_gateway}{ipfs_hash}"
-        elif ipfs_uri.startswith("ipfs/"):
-            ipfs_hash = ipfs_uri[5:]
-            return f"{self.ipfs_gateway}{ipfs_hash}"
-        elif ipfs_uri.startswith("ipfs:"):
-            ipfs_hash = ipfs_uri[5:]
-            return f"{self.ipfs_gateway}{ipfs_hash}"
-        # Already in HTTP format or other type of URI
-        return ipfs_uri
+        return _resolve_storage_uri(ipfs_uri, self.ipfs_gateway, None)
     
     def resolve_arweave_url(self, arweave_uri: str) -> str:
         """Convert Arweave URI to HTTP URL using configured gateway"""
-        if not arweave_uri:
-            return ""
-            
-        # Handle various Arweave URI formats
-        if arweave_uri.startswith("ar://"):
-            ar_hash = arweave_uri[5:]
-            return f"{self.arweave_gateway}{ar_hash}"
-        elif arweave_uri.startswith("ar/"):
-            ar_hash = arweave_uri[3:]
-            return f"{self.arweave_gateway}{ar_hash}"
-        elif arweave_uri.startswith("ar:"):
-            ar_hash = arweave_uri[3:]
-            return f"{self.arweave_gateway}{ar_hash}"
-        # Already in HTTP format or other type of URI
-        return arweave_uri
+        return _resolve_storage_uri(arweave_uri, None, self.arweave_gateway)
     
     def resolve_metadata_uri(self, uri: str) -> str:
         """Resolve a URI to an HTTP URL based on its protocol"""
-        if not uri:
-            return ""
-            
-        if uri.startswith(("ipfs://", "ipfs/", "ipfs:")):
-            return self.resolve_ipfs_url(uri)
-        elif uri.startswith(("ar://", "ar/", "ar:")):
-            return self.resolve_arweave_url(uri)
-        
-        # Already HTTP URL or other protocol
-        return uri
+        return _resolve_storage_uri(uri, self.ipfs_gateway, self.arweave_gateway)
+    
+    def _cached_json(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of cached JSON for a URL, or None if it is missing or expired"""
+        entry = self._json_cache.get(url)
+        if entry is None:
+            return None
+        data, expires = entry
+        if expires <= time.time():
+            del self._json_cache[url]
+            return None
+        # Callers may modify the returned metadata, so never hand out the cached object
+        return copy.deepcopy(data)
+    
+    def _cache_json(self, url: str, data: Dict[str, Any]) -> None:
+        """Cache fetched JSON by URL; content-addressed IPFS URLs never expire"""
+        if len(self._json_cache) >= _JSON_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._json_cache[next(iter(self._json_cache))]
+        expires = float("inf") if _IPFS_CID_RE.search(url) else time.time() + _JSON_CACHE_TTL
+        self._json_cache[url] = (copy.deepcopy(data), expires)
     
     def fetch_json(self, url: str) -> Dict[str, Any]:
-        """Fetch JSON data from a URL"""
-        import requests
+        """Fetch JSON data from a URL, served from the shared cache when possible"""
+        cached = self._cached_json(url)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            response = self._http.get(url, timeout=10)
+            if response.status_code >= 400:
+                raise HTTPError(f"{response.status_code} Error: {response.reason} for url: {response.url}", response=response)
+            data = _json_loads(response.content)
+            self._cache_json(url, data)
+            return data
         except Exception as e:
-            logging.error(f"Error fetching JSON from {url}: {e}")
+            logger.error("Error fetching JSON from %s: %s", url, e)
             return {}
     
     def fetch_metadata(self, metadata_uri: str) -> Dict[str, Any]:
         """Fetch and return NFT metadata from URI"""
+        cid = self.local_ipfs and _bare_cid(metadata_uri)
+        if cid:
+            data = self._fetch_local_ipfs(cid)
+            if data:
+                return data
+        
         resolved_uri = self.resolve_metadata_uri(metadata_uri)
         return self.fetch_json(resolved_uri)
+    
+    def _fetch_local_ipfs(self, cid: str) -> Dict[str, Any]:
+        """Read a JSON object from the local IPFS node, returning {} if it is unavailable"""
+        # Cached under its ipfs:// URI: content-addressed, so it never expires
+        cache_key = f"ipfs://{cid}"
+        cached = self._cached_json(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._http.post(f"{self.local_ipfs}/api/v0/cat", params={"arg": cid}, timeout=10)
+            if response.status_code >= 400:
+                raise HTTPError(f"{response.status_code} Error: {response.reason} for url: {response.url}", response=response)
+            data = _json_loads(response.content)
+            self._cache_json(cache_key, data)
+            return data
+        except Exception as e:
+            logger.warning("Local IPFS node %s could not serve %s, falling back to gateway: %s", self.local_ipfs, cid, e)
+            return {}
+    
+    async def async_fetch_json(self, url: str) -> Dict[str, Any]:
+        """Fetch JSON data from a URL without blocking the event loop"""
+        cached = self._cached_json(url)
+        if cached is not None:
+            return cached
+        
+        # Share an identical request that is already in flight instead of issuing another
+        pending = self._inflight.get(url)
+        if pending is not None:
+            data = await asyncio.shield(pending)
+            if data is not None:
+                return copy.deepcopy(data)
+            # The first request was cancelled before finishing, so fetch it ourselves
+            return await self.async_fetch_json(url)
+        
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[url] = pending
+        try:
+            data = await self._async_get_json(url)
+            pending.set_result(data)
+            return data
+        finally:
+            del self._inflight[url]
+            if not pending.done():
+                pending.set_result(None)
+    
+    async def _async_get_json(self, url: str) -> Dict[str, Any]:
+        """Issue the GET for async_fetch_json and cache a successful response"""
+        try:
+            session = await self._get_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                # Parse the body directly: gateways often serve metadata as text/plain
+                data = _json_loads(await response.read())
+            self._cache_json(url, data)
+            return data
+        except Exception as e:
+            logger.error("Error fetching JSON from %s: %s", url, e)
+            return {}
+    
+    async def async_fetch_metadata(self, metadata_uri: str) -> Dict[str, Any]:
+        """Fetch and return NFT metadata from URI without blocking the event loop"""
+        cid = self.local_ipfs and _bare_cid(metadata_uri)
+        if cid:
+            data = await self._async_fetch_local_ipfs(cid)
+            if data:
+                return data
+        
+        max_hedges = self.config.get("max_hedged_requests", _MAX_HEDGED_REQUESTS)
+        if (len(self.ipfs_gateways) > 1 and self._active_hedges < max_hedges
+                and self.resolve_ipfs_url(metadata_uri) != metadata_uri):
+            urls = [_resolve_storage_uri(metadata_uri, gateway, None) for gateway in self.ipfs_gateways[:2]]
+            return await self._hedged_fetch_json(urls)
+        
+        resolved_uri = self.resolve_metadata_uri(metadata_uri)
+        return await self.async_fetch_json(resolved_uri)
+    
+    async def _async_fetch_local_ipfs(self, cid: str) -> Dict[str, Any]:
+        """Read a JSON object from the local IPFS node without blocking, returning {} if it is unavailable"""
+        cache_key = f"ipfs://{cid}"
+        cached = self._cached_json(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            session = await self._get_session()
+            async with session.post(f"{self.local_ipfs}/api/v0/cat", params={"arg": cid}) as response:
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+            self._cache_json(cache_key, data)
+            return data
+        except Exception as e:
+            logger.warning("Local IPFS node %s could not serve %s, falling back to gateway: %s", self.local_ipfs, cid, e)
+            return {}
+    
+    async def _hedged_fetch_json(self, urls: List[str]) -> Dict[str, Any]:
+        """Fetch the same content from several gateways at once and return the first successful response"""
+        self._active_hedges += 1
+        tasks = {asyncio.ensure_future(self.async_fetch_json(url)) for url in urls}
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    data = task.result()
+                    if data:
+                        return data
+            # Every gateway failed
+            return {}
+        finally:
+            # Cancel the slower requests
+            for task in tasks:
+                task.cancel()
+            self._active_hedges -= 1
+    
+    async def fetch_metadata_many(self, metadata_uris: List[str],
+                                  concurrency: int = _METADATA_FETCH_CONCURRENCY) -> List[Union[Dict[str, Any], BaseException]]:
+        """Fetch metadata for many URIs concurrently, at most `concurrency` at a time, in the order given"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(uri: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.async_fetch_metadata(uri)
+        
+        return await asyncio.gather(*(fetch(uri) for uri in metadata_uris), return_exceptions=True)
+    
+    async def fetch_json_stream(self, url: str, prefix: str = "item") -> AsyncIterator[Any]:
+        """Yield the values at an ijson-style prefix of a JSON document while it downloads"""
+        try:
+            session = await self._get_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                try:
+                    import ijson
+                except ImportError:
+                    # Without ijson, parse the whole document and walk the prefix
+                    for item in _iter_prefix(_json_loads(await response.read()), prefix):
+                        yield item
+                    return
+                
+                async for item in ijson.items_async(response.content, prefix, use_float=True):
+                    yield item
+        except Exception as e:
+            logger.error("Error streaming JSON from %s: %s", url, e)
+    
+    async def fetch_trait(self, metadata_uri: str, trait_type: str) -> Optional[Any]:
+        """Get one attribute value from NFT metadata, stopping as soon as it has been parsed"""
+        url = self.resolve_metadata_uri(metadata_uri)
+        stream = self.fetch_json_stream(url, "attributes.item")
+        try:
+            async for attribute in stream:
+                if isinstance(attribute, dict) and attribute.get("trait_type") == trait_type:
+                    return attribute.get("value")
+            return None
+        finally:
+            await stream.aclose()
@@ -1,13 +1,163 @@
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, AsyncIterator, BinaryIO, Optional, List, Tuple, Union
+from contextlib import ExitStack
+from itertools import count
+import asyncio
+import hashlib
+import io
 import json
 import logging
-import time
 import os
-import requests
-import base64
+import shutil
+import tempfile
+import threading
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from anus.tools.web3.nft_base_tool import NFTBaseTool
 from anus.tools.base.tool_result import ToolResult
+from anus.tools.web3.solana_client_mixin import _json_dumps, _json_loads
+
+try:
+    # pybase64 decodes with SIMD instructions, several times faster on large images
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from base64 import b64decode as _b64decode
+
+try:
+    import orjson
+    
+    def _dump_metadata(metadata: Dict[str, Any]) -> bytes:
+        """Encode metadata as indented UTF-8 JSON"""
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_metadata(metadata: Dict[str, Any]) -> bytes:
+        """Encode metadata as indented UTF-8 JSON"""
+        return json.dumps(metadata, indent=2, ensure_ascii=False).encode()
+
+logger = logging.getLogger("anus.tools.web3.nft_creation_tool")
+
+# IPFS uploads the async paths run at once, to stay under the pinning service's rate limit
+_UPLOAD_CONCURRENCY = 10
+
+# Seconds allowed for one upload to the pinning service
+_UPLOAD_TIMEOUT = 30
+
+# Largest image accepted for upload unless the max_upload_bytes config option overrides it
+_MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+
+# Leading bytes that identify each accepted image format, as (offset, signature) pairs
+_IMAGE_SIGNATURES = {
+    "PNG": ((0, b"\x89PNG"),),
+    "JPEG": ((0, b"\xff\xd8\xff"),),
+    "GIF": ((0, b"GIF8"),),
+    "WebP": ((0, b"RIFF"), (8, b"WEBP")),
+    "glTF": ((0, b"glTF"),)
+}
+
+# Size in bytes of an SPL token mint account
+_MINT_ACCOUNT_SIZE = 82
+
+# Pinata's V3 upload endpoint, which has higher rate limits than the legacy pinFileToIPFS
+_PINATA_V3_UPLOAD_API = "https://uploads.pinata.cloud/v3/files"
+
+# MIME types of the file extensions NFT media uses
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".glb": "model/gltf-binary",
+    ".gltf": "model/gltf+json",
+    ".json": "application/json"
+}
+
+def _mime_type_from_url(url: str) -> str:
+    """Guess a media file's MIME type from its URL's extension, defaulting to PNG"""
+    path = url.split("?", 1)[0].split("#", 1)[0]
+    return _MIME_TYPES.get(os.path.splitext(path)[1].lower(), "image/png")
+
+def _is_supported_image(head: bytes) -> bool:
+    """Check the first 12 bytes of a file against the accepted image signatures"""
+    if head.lstrip()[:5] in (b"<?xml", b"<svg ", b"<svg>"):
+        # SVG is text, so it is only recognised by its opening tag
+        return True
+    return any(
+        all(head[offset:offset + len(magic)] == magic for offset, magic in signature)
+        for signature in _IMAGE_SIGNATURES.values()
+    )
+
+async def _prepend(head: bytes, stream) -> AsyncIterator[bytes]:
+    """Yield bytes already read from an aiohttp stream, then the rest of the stream"""
+    yield head
+    async for chunk in stream.iter_chunked(65536):
+        yield chunk
+
+class _LoggedRetry(Retry):
+    """Retry policy that logs a warning for every retried request"""
+    
+    def increment(self, method=None, url=None, *args, **kwargs):
+        retry = super().increment(method, url, *args, **kwargs)
+        response = kwargs.get("response")
+        reason = response.status if response is not None else kwargs.get("error")
+        logger.warning("Retrying %s %s (attempt %d): %s", method, url, len(retry.history), reason)
+        return retry
+
+# Serializes pin cache file updates across every tool in the process
+_pin_cache_lock = threading.Lock()
+
+# Pinning service rate limits and brief outages are retried, honoring Retry-After
+_UPLOAD_RETRY = _LoggedRetry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["POST", "GET"]),
+    respect_retry_after_header=True
+)
+
+class _StreamingUpload:
+    """
+    Multipart upload body streamed from an open file with requests_toolbelt.
+    Can be rewound to the start, so urllib3 can retry the upload.
+    """
+    
+    def __init__(self, fields: Dict[str, str], filename: str, fileobj: BinaryIO):
+        self._fields = fields
+        self._file = (filename, fileobj, _mime_type_from_url(filename))
+        self._boundary = None
+        self.seek(0)
+        self.content_type = self._encoder.content_type
+    
+    def __len__(self) -> int:
+        return self._encoder.len
+    
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._encoder.read(size)
+        self._position += len(chunk)
+        return chunk
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if offset or whence:
+            raise OSError("An upload body can only be rewound to its start")
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+        
+        self._file[1].seek(0)
+        # Keep the boundary so the Content-Type header already sent stays valid
+        self._encoder = MultipartEncoder(fields={**self._fields, "file": self._file}, boundary=self._boundary)
+        self._boundary = self._encoder.boundary_value
+        self._position = 0
+        return 0
+
+class PinError(Exception):
+    """Raised when the pinning service accepts an upload but returns no CID"""
 
 class NFTCreationTool(NFTBaseTool):
     """
@@ -16,12 +166,116 @@ class NFTCreationTool(NFTBaseTool):
     """
     name = "nft_creation"
     description = "Create and mint NFTs with metadata, image uploading, and attribute management"
+    parameters = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": [
+                    "create_metadata", "upload_image", "mint_nft", 
+                    "create_collection", "add_to_collection", "update_metadata"
+                ],
+                "description": "The NFT creation action to perform"
+            },
+            "name": {
+                "type": "string",
+                "description": "Name of the NFT or collection"
+            },
+            "description": {
+                "type": "string",
+                "description": "Description of the NFT or collection"
+            },
+            "image_url": {
+                "type": "string",
+                "description": "URL to an image for the NFT or collection"
+            },
+            "image_data": {
+                "type": "string",
+                "description": "Base64-encoded image data for direct upload"
+            },
+            "save_local": {
+                "type": "boolean",
+                "description": "Also keep a copy of the uploaded image in the temp directory (default: false)"
+            },
+            "attributes": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "trait_type": {"type": "string"},
+                        "value": {"type": "string"}
+                    }
+                },
+                "description": "Array of attribute objects with trait_type and value properties"
+            },
+            "collection_address": {
+                "type": "string",
+                "description": "Address of the collection for the NFT"
+            },
+            "supply": {
+                "type": "integer",
+                "description": "Number of copies to mint (default: 1 for standard NFT)"
+            },
+            "creator_royalties": {
+                "type": "number",
+                "description": "Percentage of royalties for secondary sales (0-100)"
+            },
+            "external_url": {
+                "type": "string",
+                "description": "External URL for the NFT"
+            },
+            "blockchain": {
+                "type": "string",
+                "enum": ["solana", "ethereum", "polygon"],
+                "description": "Blockchain to mint the NFT on (default: solana)"
+            },
+            "metadata_uri": {
+                "type": "string",
+                "description": "URI to existing metadata for minting"
+            },
+            "recipient_address": {
+                "type": "string",
+                "description": "Recipient wallet address for the minted NFT"
+            },
+            "is_mutable": {
+                "type": "boolean",
+                "description": "Whether the NFT metadata can be changed after minting"
+            },
+            "category": {
+                "type": "string",
+                "description": "Category or type of the NFT (e.g., art, collectible, game)"
+            }
+        },
+        "required": ["action"]
+    }
+    
+    # Action name -> (handler method, {argument: default used when it is not supplied})
+    _ACTION_DISPATCH = {
+        "create_metadata": ("_create_metadata", {
+            "name": "", "description": "", "image_url": "", "attributes": None,
+            "external_url": "", "collection_address": None, "category": ""
+        }),
+        "upload_image": ("_upload_image", {"image_url": None, "image_data": None, "save_local": False}),
+        "mint_nft": ("_mint_nft", {
+            "metadata_uri": None, "recipient_address": None, "supply": 1,
+            "blockchain": "solana", "is_mutable": True
+        }),
+        "create_collection": ("_create_collection", {
+            "name": "", "description": "", "image_url": "", "creator_royalties": 5, "blockchain": "solana"
+        }),
+        "add_to_collection": ("_add_to_collection", {"nft_address": None, "collection_address": None}),
+        "update_metadata": ("_update_metadata", {"nft_address": None})
+    }
+    
+    # RPC URL -> rent-exempt minimum for a mint account, which only changes with the cluster's rent parameters
+    _mint_rent_exemption = {}
     
     def __init__(self, 
                  rpc_url: str = "https://api.mainnet-beta.solana.com",
                  private_key_path: Optional[str] = None,
                  ipfs_upload_api: Optional[str] = None,
                  ipfs_api_key: Optional[str] = None,
+                 ipfs_upload_api_v3: Optional[str] = None,
                  temp_dir: str = "./temp",
                  **kwargs):
         super().__init__(rpc_url=rpc_url, private_key_path=private_key_path, **kwargs)
@@ -29,152 +283,73 @@ class NFTCreationTool(NFTBaseTool):
         # IPFS upload configuration
         self.ipfs_upload_api = ipfs_upload_api or "https://api.pinata.cloud/pinning/pinFileToIPFS"
         self.ipfs_api_key = ipfs_api_key
+        # Built once rather than per upload; kept off the shared session so gateways never see the key
+        self._ipfs_headers = {"Authorization": f"Bearer {ipfs_api_key}"} if ipfs_api_key else {}
+        # Pinata V3 is used unless a legacy-style upload API is given explicitly
+        self.ipfs_upload_api_v3 = ipfs_upload_api_v3 or (None if ipfs_upload_api else _PINATA_V3_UPLOAD_API)
+        self._upload_endpoint = self.ipfs_upload_api_v3 or self.ipfs_upload_api
+        self._upload_fields = {"network": "public"} if self.ipfs_upload_api_v3 else {}
+        # Uploads also retry POSTs; the adapter is mounted for the upload endpoint only
+        self._http.mount(self._upload_endpoint, HTTPAdapter(max_retries=_UPLOAD_RETRY))
         
         # Temporary directory for file operations
         self.temp_dir = temp_dir
         os.makedirs(self.temp_dir, exist_ok=True)
-    
-    @property
-    def parameters(self) -> Dict:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": [
-                        "create_metadata", "upload_image", "mint_nft", 
-                        "create_collection", "add_to_collection", "update_metadata"
-                    ],
-                    "description": "The NFT creation action to perform"
-                },
-                "name": {
-                    "type": "string",
-                    "description": "Name of the NFT or collection"
-                },
-                "description": {
-                    "type": "string",
-                    "description": "Description of the NFT or collection"
-                },
-                "image_url": {
-                    "type": "string",
-                    "description": "URL to an image for the NFT or collection"
-                },
-                "image_data": {
-                    "type": "string",
-                    "description": "Base64-encoded image data for direct upload"
-                },
-                "attributes": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "trait_type": {"type": "string"},
-                            "value": {"type": "string"}
-                        }
-                    },
-                    "description": "Array of attribute objects with trait_type and value properties"
-                },
-                "collection_address": {
-                    "type": "string",
-                    "description": "Address of the collection for the NFT"
-                },
-                "supply": {
-                    "type": "integer",
-                    "description": "Number of copies to mint (default: 1 for standard NFT)"
-                },
-                "creator_royalties": {
-                    "type": "number",
-                    "description": "Percentage of royalties for secondary sales (0-100)"
-                },
-                "external_url": {
-                    "type": "string",
-                    "description": "External URL for the NFT"
-                },
-                "blockchain": {
-                    "type": "string",
-                    "enum": ["solana", "ethereum", "polygon"],
-                    "description": "Blockchain to mint the NFT on (default: solana)"
-                },
-                "metadata_uri": {
-                    "type": "string",
-                    "description": "URI to existing metadata for minting"
-                },
-                "recipient_address": {
-                    "type": "string",
-                    "description": "Recipient wallet address for the minted NFT"
-                },
-                "is_mutable": {
-                    "type": "boolean",
-                    "description": "Whether the NFT metadata can be changed after minting"
-                },
-                "category": {
-                    "type": "string",
-                    "description": "Category or type of the NFT (e.g., art, collectible, game)"
-                }
-            },
-            "required": ["action"]
-        }
+        
+        # Caps concurrent async uploads; created for the running event loop on first use
+        self._upload_semaphore = None
+        self._upload_loop = None
+        
+        # Numbers temp files so files created within the same second don't overwrite each other
+        self._fname_counter = count()
+        
+        # SHA-256 of pinned content -> its ipfs:// URI, so identical bytes are only uploaded once.
+        # The file is shared by every endpoint and account; each keeps its pins under its own scope
+        self._pin_cache_path = os.path.join(self.temp_dir, ".pin_cache.json")
+        key_id = hashlib.sha256(ipfs_api_key.encode()).hexdigest()[:16] if ipfs_api_key else ""
+        self._pin_scope = f"{self._upload_endpoint}#{key_id}"
+        self._pin_cache = self._read_pin_cache().get(self._pin_scope, {})
     
     def execute(self, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """Execute the NFT creation tool with the given parameters"""
         action = kwargs.get("action")
         
+        spec = self._ACTION_DISPATCH.get(action)
+        if spec is None:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Unknown NFT creation action: {action}"
+            )
+        
+        method_name, defaults = spec
+        args = {key: kwargs.get(key, default) for key, default in defaults.items()}
+        if action == "update_metadata":
+            # Every other argument is a candidate metadata update
+            args["updates"] = kwargs
+        
         try:
-            if action == "create_metadata":
-                return self._create_metadata(
-                    name=kwargs.get("name", ""),
-                    description=kwargs.get("description", ""),
-                    image_url=kwargs.get("image_url", ""),
-                    attributes=kwargs.get("attributes", []),
-                    external_url=kwargs.get("external_url", ""),
-                    collection_address=kwargs.get("collection_address"),
-                    category=kwargs.get("category", "")
-                )
-            elif action == "upload_image":
-                return self._upload_image(
-                    image_url=kwargs.get("image_url"),
-                    image_data=kwargs.get("image_data")
-                )
-            elif action == "mint_nft":
-                return self._mint_nft(
-                    metadata_uri=kwargs.get("metadata_uri"),
-                    recipient_address=kwargs.get("recipient_address"),
-                    supply=kwargs.get("supply", 1),
-                    blockchain=kwargs.get("blockchain", "solana"),
-                    is_mutable=kwargs.get("is_mutable", True)
-                )
-            elif action == "create_collection":
-                return self._create_collection(
-                    name=kwargs.get("name", ""),
-                    description=kwargs.get("description", ""),
-                    image_url=kwargs.get("image_url", ""),
-                    royalties=kwargs.get("creator_royalties", 5),
-                    blockchain=kwargs.get("blockchain", "solana")
-                )
-            elif action == "add_to_collection":
-                return self._add_to_collection(
-                    nft_address=kwargs.get("nft_address"),
-                    collection_address=kwargs.get("collection_address")
-                )
-            elif action == "update_metadata":
-                return self._update_metadata(
-                    nft_address=kwargs.get("nft_address"),
-                    updates=kwargs
-                )
-            else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Unknown NFT creation action: {action}"
-                )
+            return getattr(self, method_name)(**args)
         except Exception as e:
-            logging.error(f"Error executing NFT creation action {action}: {e}")
+            logger.error("Error executing NFT creation action %s: %s", action, e)
             return ToolResult(
                 tool_name=self.name,
                 status="error",
                 error=f"Error executing NFT creation action {action}: {str(e)}"
             )
     
+    async def async_execute(self, **kwargs) -> Union[Dict[str, Any], ToolResult]:
+        """Execute the tool without blocking the event loop"""
+        if kwargs.get("action") == "upload_image":
+            _, defaults = self._ACTION_DISPATCH["upload_image"]
+            return await self._upload_image_async(**{key: kwargs.get(key, default) for key, default in defaults.items()})
+        # Actions without a native async path run in a worker thread
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
+    async def execute_many(self, batch: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], ToolResult]]:
+        """Execute independent actions concurrently, returning their results in order"""
+        return await asyncio.gather(*(self.async_execute(**kwargs) for kwargs in batch))
+    
     def _create_metadata(self, name: str, description: str, image_url: str, 
                         attributes: List[Dict[str, str]] = None, external_url: str = "", 
                         collection_address: Optional[str] = None, category: str = "") -> ToolResult:
@@ -196,7 +371,7 @@ class NFTCreationTool(NFTBaseTool):
                 "files": [
                     {
                         "uri": image_url,
-                        "type": self._guess_mime_type(image_url)
+                        "type": _mime_type_from_url(image_url)
                     }
                 ],
                 "category": category or "image",
@@ -220,11 +395,10 @@ class NFTCreationTool(NFTBaseTool):
             }
         
         # Generate temporary JSON file
-        timestamp = int(time.time())
-        json_path = os.path.join(self.temp_dir, f"metadata_{timestamp}.json")
+        json_path = os.path.join(self.temp_dir, self._tmpname("metadata", ".json"))
         
-        with open(json_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        with open(json_path, 'wb') as f:
+            f.write(_dump_metadata(metadata))
         
         return ToolResult.success(
             tool_name=self.name,
@@ -235,7 +409,8 @@ class NFTCreationTool(NFTBaseTool):
             }
         )
     
-    def _upload_image(self, image_url: Optional[str] = None, image_data: Optional[str] = None) -> ToolResult:
+    def _upload_image(self, image_url: Optional[str] = None, image_data: Optional[str] = None,
+                      save_local: bool = False) -> ToolResult:
         """Upload an image to IPFS and return the IPFS URI"""
         if not self.ipfs_api_key:
             return ToolResult(
@@ -252,87 +427,104 @@ class NFTCreationTool(NFTBaseTool):
             )
         
         try:
-            # If image_url is provided, download the image first
+            # If image_url is provided, the download is read in chunks by _pin_to_ipfs, never held whole in memory
             if image_url:
-                timestamp = int(time.time())
                 extension = self._get_extension_from_url(image_url)
-                local_path = os.path.join(self.temp_dir, f"image_{timestamp}{extension}")
-                
-                response = requests.get(image_url, stream=True, timeout=10)
+                response = self._http.get(image_url, stream=True, timeout=10)
                 response.raise_for_status()
-                
-                with open(local_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                # Undo any Content-Encoding as the body is read
+                response.raw.decode_content = True
+                # Buffered so the leading bytes can be checked without consuming them;
+                # the buffer needs the raw stream to stay open after the last read
+                response.raw.auto_close = False
+                content = io.BufferedReader(response.raw, 65536)
+                rejected = self._check_upload(content.peek(12)[:12], response.headers.get("Content-Length"))
+                if rejected:
+                    response.close()
+                    return rejected
             
-            # If image_data is provided (base64), decode and save it
+            # If image_data is provided (base64), decode it
             elif image_data:
-                try:
-                    timestamp = int(time.time())
-                    # Try to determine image format from base64 data
-                    if image_data.startswith("data:image/"):
-                        # Extract mime type and data
-                        mime_format = image_data.split(";")[0].split("/")[1]
-                        extension = f".{mime_format}"
-                        # Remove the data URL prefix
-                        image_data = image_data.split(",")[1]
-                    else:
-                        # Default to PNG if format not detected
-                        extension = ".png"
-                    
-                    local_path = os.path.join(self.temp_dir, f"image_{timestamp}{extension}")
-                    
-                    image_bytes = base64.b64decode(image_data)
-                    with open(local_path, 'wb') as f:
-                        f.write(image_bytes)
-                except Exception as e:
-                    return ToolResult(
-                        tool_name=self.name,
-                        status="error",
-                        error=f"Error decoding base64 image data: {str(e)}"
-                    )
+                decoded = self._decode_image_data(image_data)
+                if isinstance(decoded, ToolResult):
+                    return decoded
+                content, extension = decoded
+                rejected = self._check_upload(content[:12], len(content))
+                if rejected:
+                    return rejected
+            
+            filename = self._tmpname("image", extension)
+            local_path = self._save_local_copy(filename, content) if save_local else None
             
             # Upload to IPFS
-            headers = {
-                "Authorization": f"Bearer {self.ipfs_api_key}"
-            }
+            ipfs_uri = self._pin_to_ipfs(local_path or content, filename)
+            return self._image_upload_result(ipfs_uri, local_path)
+        except PinError as e:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"IPFS upload failed: {e}"
+            )
+        except Exception as e:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Error uploading image: {str(e)}"
+            )
+    
+    async def _upload_image_async(self, image_url: Optional[str] = None, image_data: Optional[str] = None,
+                                  save_local: bool = False) -> ToolResult:
+        """Upload an image to IPFS without blocking the event loop, so many uploads can run concurrently"""
+        if not self.ipfs_api_key:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error="IPFS API key is required for image upload. Please set ipfs_api_key."
+            )
             
-            with open(local_path, 'rb') as f:
-                files = {
-                    'file': (os.path.basename(local_path), f)
-                }
-                
-                response = requests.post(
-                    self.ipfs_upload_api,
-                    headers=headers,
-                    files=files,
-                    timeout=30
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                if 'IpfsHash' in result:
-                    ipfs_hash = result['IpfsHash']
-                    ipfs_uri = f"ipfs://{ipfs_hash}"
-                    http_url = self.resolve_ipfs_url(ipfs_uri)
-                    
-                    return ToolResult.success(
-                        tool_name=self.name,
-                        result={
-                            "ipfs_uri": ipfs_uri,
-                            "http_url": http_url,
-                            "ipfs_hash": ipfs_hash,
-                            "local_path": local_path
-                        }
-                    )
-                else:
-                    return ToolResult(
-                        tool_name=self.name,
-                        status="error",
-                        error=f"IPFS upload failed: {result}"
-                    )
-                    
+        if not image_url and not image_data:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error="Either image_url or image_data is required"
+            )
+        
+        try:
+            if image_url:
+                filename = self._tmpname("image", self._get_extension_from_url(image_url))
+                session = await self._get_session()
+                async with session.get(image_url) as response:
+                    response.raise_for_status()
+                    try:
+                        head = await response.content.readexactly(12)
+                    except asyncio.IncompleteReadError as e:
+                        head = e.partial
+                    rejected = self._check_upload(head, response.content_length)
+                    if rejected:
+                        return rejected
+                    if not save_local:
+                        # Pipe the download into the upload as it arrives
+                        ipfs_uri = await self._upload_ipfs_async(filename, _prepend(head, response.content))
+                        return self._image_upload_result(ipfs_uri, None)
+                    content = head + await response.read()
+            else:
+                decoded = self._decode_image_data(image_data)
+                if isinstance(decoded, ToolResult):
+                    return decoded
+                content, extension = decoded
+                rejected = self._check_upload(content[:12], len(content))
+                if rejected:
+                    return rejected
+                filename = self._tmpname("image", extension)
+            
+            local_path = self._save_local_copy(filename, content) if save_local else None
+            return self._image_upload_result(await self._upload_ipfs_async(filename, content), local_path)
+        except PinError as e:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"IPFS upload failed: {e}"
+            )
         except Exception as e:
             return ToolResult(
                 tool_name=self.name,
@@ -340,6 +532,202 @@ class NFTCreationTool(NFTBaseTool):
                 error=f"Error uploading image: {str(e)}"
             )
     
+    def _decode_image_data(self, image_data: str) -> Union[Tuple[bytes, str], ToolResult]:
+        """Decode base64 image data, returning the image bytes and a file extension"""
+        try:
+            # Try to determine image format from base64 data
+            if image_data.startswith("data:image/"):
+                # Extract mime type and data, copying the payload only once
+                data_start = image_data.index(",") + 1
+                mime_format = image_data[11:data_start].split(";", 1)[0]
+                extension = f".{mime_format}"
+                # Remove the data URL prefix
+                image_data = image_data[data_start:]
+            else:
+                # Default to PNG if format not detected
+                extension = ".png"
+            
+            return _b64decode(image_data), extension
+        except Exception as e:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Error decoding base64 image data: {str(e)}"
+            )
+    
+    def _check_upload(self, head: bytes, size: Union[int, str, None]) -> Optional[ToolResult]:
+        """Reject an image that is too large or not a supported format before it is uploaded"""
+        max_bytes = self.config.get("max_upload_bytes", _MAX_UPLOAD_BYTES)
+        if size is not None and int(size) > max_bytes:
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Image is {int(size)} bytes, over the {max_bytes} byte upload limit"
+            )
+        
+        if not _is_supported_image(head):
+            return ToolResult(
+                tool_name=self.name,
+                status="error",
+                error=f"Unsupported image format; expected one of {', '.join(_IMAGE_SIGNATURES)} or SVG"
+            )
+        return None
+    
+    def _tmpname(self, prefix: str, extension: str) -> str:
+        """Return a temp file name that is unique within this process"""
+        return f"{prefix}_{next(self._fname_counter)}_{os.urandom(3).hex()}{extension}"
+    
+    def _save_local_copy(self, filename: str, content: Union[bytes, BinaryIO]) -> str:
+        """Write image bytes or a readable stream to temp_dir and return the file's path"""
+        local_path = os.path.join(self.temp_dir, filename)
+        with open(local_path, 'wb') as f:
+            if isinstance(content, bytes):
+                f.write(content)
+            else:
+                shutil.copyfileobj(content, f, 8192)
+        return local_path
+    
+    def _image_upload_result(self, ipfs_uri: str, local_path: Optional[str]) -> ToolResult:
+        """Build the upload_image result for a pinned image"""
+        return ToolResult.success(
+            tool_name=self.name,
+            result={
+                "ipfs_uri": ipfs_uri,
+                "http_url": self.resolve_ipfs_url(ipfs_uri),
+                "ipfs_hash": ipfs_uri[len("ipfs://"):],
+                "local_path": local_path
+            }
+        )
+    
+    @staticmethod
+    def _pinned_uri(result: Dict[str, Any]) -> str:
+        """Get the ipfs:// URI from a legacy ("IpfsHash") or V3 ("data.cid") Pinata upload response"""
+        cid = result.get('IpfsHash')
+        if not cid and isinstance(result.get('data'), dict):
+            cid = result['data'].get('cid')
+        if not cid:
+            raise PinError(result)
+        return f"ipfs://{cid}"
+    
+    def _pin_to_ipfs(self, content: Union[str, bytes, BinaryIO], filename: str) -> str:
+        """Pin a file path, bytes or file object to IPFS and return its ipfs:// URI"""
+        with ExitStack() as stack:
+            if isinstance(content, str):
+                # Files are hashed in chunks here and streamed by _post_upload, never read whole
+                body = stack.enter_context(open(content, 'rb'))
+                digest = hashlib.file_digest(body, "sha256").hexdigest()
+            elif isinstance(content, bytes):
+                body = io.BytesIO(content)
+                digest = hashlib.sha256(content).hexdigest()
+            else:
+                # Streams are hashed as they are copied to a temp file, which is then
+                # streamed to the pinning service and can be rewound for a retry
+                body = stack.enter_context(tempfile.TemporaryFile(dir=self.temp_dir))
+                digest = self._spool(content, body)
+            
+            ipfs_uri = self._pin_cache.get(digest)
+            if ipfs_uri:
+                return ipfs_uri
+            
+            response = self._post_upload(filename, body)
+        
+        response.raise_for_status()
+        ipfs_uri = self._pinned_uri(_json_loads(response.content))
+        self._remember_pin(digest, ipfs_uri)
+        return ipfs_uri
+    
+    @staticmethod
+    def _spool(stream: BinaryIO, spool: BinaryIO) -> str:
+        """Copy a stream into a spool file in chunks and return the SHA-256 of its content"""
+        digest = hashlib.sha256()
+        while chunk := stream.read(65536):
+            digest.update(chunk)
+            spool.write(chunk)
+        return digest.hexdigest()
+    
+    def _post_upload(self, filename: str, body: BinaryIO):
+        """POST a seekable file object to the pinning service, streaming it when requests_toolbelt is installed"""
+        try:
+            form = _StreamingUpload(self._upload_fields, filename, body)
+        except ImportError:
+            pass
+        else:
+            return self._http.post(
+                self._upload_endpoint,
+                headers={**self._ipfs_headers, "Content-Type": form.content_type},
+                data=form,
+                timeout=30
+            )
+        
+        # Without requests_toolbelt, requests builds the whole multipart body in memory
+        return self._http.post(
+            self._upload_endpoint,
+            headers=self._ipfs_headers,
+            files={'file': (filename, body)},
+            data=self._upload_fields,
+            timeout=30
+        )
+    
+    def _read_pin_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load the pin cache file as {scope: {digest: ipfs_uri}}, skipping anything malformed"""
+        try:
+            with open(self._pin_cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {scope: pins for scope, pins in cache.items() if isinstance(pins, dict)}
+    
+    def _remember_pin(self, digest: str, ipfs_uri: str) -> None:
+        """Record pinned content by hash and persist the pin cache to temp_dir"""
+        self._pin_cache[digest] = ipfs_uri
+        with _pin_cache_lock:
+            # Merge with the file as it is now, so tools sharing temp_dir keep each other's pins
+            cache = self._read_pin_cache()
+            cache[self._pin_scope] = {**cache.get(self._pin_scope, {}), **self._pin_cache}
+            try:
+                # Write a sibling file and swap it in, so a crash never leaves a truncated cache
+                tmp_path = f"{self._pin_cache_path}.{os.urandom(3).hex()}"
+                with open(tmp_path, 'wb') as f:
+                    f.write(_json_dumps(cache))
+                os.replace(tmp_path, self._pin_cache_path)
+            except OSError as e:
+                logger.warning("Could not save IPFS pin cache: %s", e)
+    
+    async def _upload_ipfs_async(self, filename: str, content: Any) -> str:
+        """Pin bytes, a file object or a stream to IPFS, at most _UPLOAD_CONCURRENCY at a time, and return its ipfs:// URI"""
+        import aiohttp
+        
+        # Content already in memory can be checked against the pin cache; streams are uploaded as they arrive
+        digest = hashlib.sha256(content).hexdigest() if isinstance(content, bytes) else None
+        if digest in self._pin_cache:
+            return self._pin_cache[digest]
+        
+        loop = asyncio.get_running_loop()
+        if self._upload_loop is not loop:
+            self._upload_semaphore = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+            self._upload_loop = loop
+        
+        async with self._upload_semaphore:
+            session = await self._get_session()
+            form = aiohttp.FormData()
+            form.add_field('file', content, filename=filename)
+            for field, value in self._upload_fields.items():
+                form.add_field(field, value)
+            async with session.post(
+                self._upload_endpoint,
+                headers=self._ipfs_headers,
+                data=form,
+                timeout=aiohttp.ClientTimeout(total=_UPLOAD_TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+                ipfs_uri = self._pinned_uri(_json_loads(await response.read()))
+        
+        if digest:
+            self._remember_pin(digest, ipfs_uri)
+        return ipfs_uri
+    
     def _mint_nft(self, metadata_uri: str, recipient_address: Optional[str] = None, 
                  supply: int = 1, blockchain: str = "solana", is_mutable: bool = True) -> ToolResult:
         """Mint an NFT on the specified blockchain"""
@@ -362,38 +750,20 @@ class NFTCreationTool(NFTBaseTool):
             try:
                 # If metadata_uri is a local file, upload it to IPFS first
                 if os.path.isfile(metadata_uri):
-                    # Read the metadata file
-                    with open(metadata_uri, 'r') as f:
-                        metadata = json.load(f)
+                    # Read the metadata file once; the same bytes are validated and uploaded
+                    with open(metadata_uri, 'rb') as f:
+                        metadata_bytes = f.read()
+                    metadata = _json_loads(metadata_bytes)
                     
                     # Upload metadata to IPFS
                     if self.ipfs_api_key:
-                        headers = {
-                            "Authorization": f"Bearer {self.ipfs_api_key}"
-                        }
-                        
-                        files = {
-                            'file': (os.path.basename(metadata_uri), open(metadata_uri, 'rb'))
-                        }
-                        
-                        response = requests.post(
-                            self.ipfs_upload_api,
-                            headers=headers,
-                            files=files,
-                            timeout=30
-                        )
-                        
-                        response.raise_for_status()
-                        result = response.json()
-                        
-                        if 'IpfsHash' in result:
-                            ipfs_hash = result['IpfsHash']
-                            metadata_uri = f"ipfs://{ipfs_hash}"
-                        else:
+                        try:
+                            metadata_uri = self._pin_to_ipfs(metadata_bytes, os.path.basename(metadata_uri))
+                        except PinError as e:
                             return ToolResult(
                                 tool_name=self.name,
                                 status="error",
-                                error=f"Metadata upload to IPFS failed: {result}"
+                                error=f"Metadata upload to IPFS failed: {e}"
                             )
                     else:
                         return ToolResult(
@@ -406,6 +776,8 @@ class NFTCreationTool(NFTBaseTool):
                 from solana.keypair import Keypair
                 from solana.publickey import PublicKey
                 from solana.transaction import Transaction
+                from solana.rpc.commitment import Processed
+                from solana.rpc.types import TxOpts
                 from solana.system_program import CreateAccountParams, create_account
                 from spl.token.instructions import create_mint
                 from spl.token.constants import TOKEN_PROGRAM_ID
@@ -414,9 +786,11 @@ class NFTCreationTool(NFTBaseTool):
                 # Create a new keypair for the NFT
                 mint_keypair = Keypair()
                 
-                # First create a token mint account
-                resp = self._client.get_minimum_balance_for_rent_exemption(82)
-                lamports = resp["result"]
+                # First create a token mint account, funded with the cached rent-exempt minimum
+                lamports = self._mint_rent_exemption.get(self.rpc_url)
+                if lamports is None:
+                    resp = self._client.get_minimum_balance_for_rent_exemption(_MINT_ACCOUNT_SIZE)
+                    lamports = self._mint_rent_exemption[self.rpc_url] = resp["result"]
                 
                 # Create system account for token mint
                 create_account_ix = create_account(
@@ -424,7 +798,7 @@ class NFTCreationTool(NFTBaseTool):
                         from_pubkey=self._keypair.public_key,
                         new_account_pubkey=mint_keypair.public_key,
                         lamports=lamports,
-                        space=82,
+                        space=_MINT_ACCOUNT_SIZE,
                         program_id=TOKEN_PROGRAM_ID
                     )
                 )
@@ -439,14 +813,14 @@ class NFTCreationTool(NFTBaseTool):
                 )
                 
                 # Create metadata instruction
-                recipient = recipient_address if recipient_address else str(self._keypair.public_key)
+                recipient = recipient_address if recipient_address else self._wallet_address
                 metadata_args = {
                     "name": "",  # Will be filled from URI
                     "symbol": "",  # Will be filled from URI
                     "uri": metadata_uri,
                     "creators": [
                         {
-                            "address": str(self._keypair.public_key),
+                            "address": self._wallet_address,
                             "verified": True,
                             "share": 100
                         }
@@ -467,9 +841,13 @@ class NFTCreationTool(NFTBaseTool):
                     create_account_ix, create_mint_ix, create_metadata_ix
                 )
                 
-                # Sign and send transaction
+                # Sign and send transaction; skipping the preflight simulation saves an RPC round trip
                 transaction_signature = self._client.send_transaction(
-                    transaction, self._keypair, mint_keypair
+                    transaction, self._keypair, mint_keypair,
+                    opts=TxOpts(
+                        skip_preflight=self.config.get("skip_preflight", True),
+                        preflight_commitment=Processed
+                    )
                 )
                 
                 if "result" in transaction_signature:
@@ -521,7 +899,7 @@ class NFTCreationTool(NFTBaseTool):
             )
     
     def _create_collection(self, name: str, description: str, image_url: str, 
-                         royalties: float = 5.0, blockchain: str = "solana") -> ToolResult:
+                         creator_royalties: float = 5.0, blockchain: str = "solana") -> ToolResult:
         """Create an NFT collection"""
         # For collection creation, we use a similar process to NFT minting
         # but with special collection attributes
@@ -536,7 +914,7 @@ class NFTCreationTool(NFTBaseTool):
                 "files": [
                     {
                         "uri": image_url,
-                        "type": self._guess_mime_type(image_url)
+                        "type": _mime_type_from_url(image_url)
                     }
                 ],
                 "category": "collection",
@@ -547,74 +925,52 @@ class NFTCreationTool(NFTBaseTool):
                     }
                 ]
             },
-            "seller_fee_basis_points": int(royalties * 100),  # Convert percentage to basis points
+            "seller_fee_basis_points": int(creator_royalties * 100),  # Convert percentage to basis points
             "is_collection": True
         }
         
         # Generate temporary JSON file
-        timestamp = int(time.time())
-        json_path = os.path.join(self.temp_dir, f"collection_{timestamp}.json")
+        json_path = os.path.join(self.temp_dir, self._tmpname("collection", ".json"))
         
-        with open(json_path, 'w') as f:
-            json.dump(collection_metadata, f, indent=2)
+        with open(json_path, 'wb') as f:
+            f.write(_dump_metadata(collection_metadata))
         
         # For Solana, we need to first upload the metadata and then mint the collection NFT
         if blockchain.lower() == "solana":
             # Upload metadata if IPFS key is available
             if self.ipfs_api_key:
-                # Code to upload metadata to IPFS
-                headers = {
-                    "Authorization": f"Bearer {self.ipfs_api_key}"
-                }
-                
-                files = {
-                    'file': (os.path.basename(json_path), open(json_path, 'rb'))
-                }
-                
                 try:
-                    response = requests.post(
-                        self.ipfs_upload_api,
-                        headers=headers,
-                        files=files,
-                        timeout=30
-                    )
+                    metadata_uri = self._pin_to_ipfs(json_path, os.path.basename(json_path))
                     
-                    response.raise_for_status()
-                    result = response.json()
+                    # Now mint the collection as an NFT
+                    mint_result = self._mint_nft(
+                        metadata_uri=metadata_uri,
+                        recipient_address=None,  # Use default (minter)
+                        supply=1,
+                        blockchain=blockchain,
+                        is_mutable=True  # Collections are typically mutable
+                    )
                     
-                    if 'IpfsHash' in result:
-                        ipfs_hash = result['IpfsHash']
-                        metadata_uri = f"ipfs://{ipfs_hash}"
-                        
-                        # Now mint the collection as an NFT
-                        mint_result = self._mint_nft(
-                            metadata_uri=metadata_uri,
-                            recipient_address=None,  # Use default (minter)
-                            supply=1,
-                            blockchain=blockchain,
-                            is_mutable=True  # Collections are typically mutable
-                        )
+                    if mint_result.status == "success":
+                        # Add collection-specific information to the result
+                        result_data = mint_result.result
+                        result_data["collection_name"] = name
+                        result_data["collection_description"] = description
+                        result_data["royalties"] = creator_royalties
+                        result_data["type"] = "collection"
                         
-                        if mint_result.status == "success":
-                            # Add collection-specific information to the result
-                            result_data = mint_result.result
-                            result_data["collection_name"] = name
-                            result_data["collection_description"] = description
-                            result_data["royalties"] = royalties
-                            result_data["type"] = "collection"
-                            
-                            return ToolResult.success(
-                                tool_name=self.name,
-                                result=result_data
-                            )
-                        else:
-                            return mint_result  # Return the error from minting
-                    else:
-                        return ToolResult(
+                        return ToolResult.success(
                             tool_name=self.name,
-                            status="error",
-                            error=f"Metadata upload to IPFS failed: {result}"
+                            result=result_data
                         )
+                    else:
+                        return mint_result  # Return the error from minting
+                except PinError as e:
+                    return ToolResult(
+                        tool_name=self.name,
+                        status="error",
+                        error=f"Metadata upload to IPFS failed: {e}"
+                    )
                 except Exception as e:
                     return ToolResult(
                         tool_name=self.name,
@@ -1,120 +1,373 @@
-from typing import Dict, Any, Optional, List, Union
-import json
+from typing import Dict, Any, Optional, List, Tuple, Union
+from functools import lru_cache
+import asyncio
+import copy
 import logging
-import requests
+import re
 import time
-from datetime import datetime
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestConnectionError, HTTPError, RetryError, Timeout
+from urllib3.util.retry import Retry
 from anus.tools.base.tool import BaseTool
 from anus.tools.base.tool_result import ToolResult
+from anus.tools.web3.solana_client_mixin import SolanaClientMixin, _json_body, _json_dumps, _json_loads
 
-class SocialFiBaseTool(BaseTool):
+try:
+    # Probed once at import; a failed import would otherwise be retried on every fetch_json_keys call
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    from aiohttp import ClientConnectionError, ClientResponseError
+except ImportError:
+    # Without aiohttp the async_* methods can't run, so these errors never occur
+    ClientConnectionError = ClientResponseError = type("_AiohttpUnavailable", (Exception,), {})
+
+logger = logging.getLogger("anus.tools.web3.socialfi_base_tool")
+
+# Fetched JSON is cached per (URL, headers) for this many seconds, up to _JSON_CACHE_MAXSIZE entries
+_JSON_CACHE_TTL = 300
+_JSON_CACHE_MAXSIZE = 10_000
+
+# Default number of requests fetch_many and post_many run at once
+_FETCH_CONCURRENCY = 32
+
+# Transient failures are retried with exponential backoff; indexer POSTs are queries, so they are retried too
+_HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "POST"])
+)
+
+# Seconds a host is skipped after its retries are exhausted, unless the host_cooldown config option overrides it
+_HOST_COOLDOWN = 30
+
+# Bitcoin-style base58 alphabet used by Solana addresses, and each character's digit value
+_B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_DIGITS = {char: digit for digit, char in enumerate(_B58_ALPHABET)}
+
+# Base58 strings of the 32 to 44 characters a 32-byte key encodes to
+_SOLANA_ADDRESS_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+# 0x-prefixed 20-byte hex address used by Ethereum and Polygon
+_EVM_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+@lru_cache(maxsize=8)
+def _iso_second(second: int) -> str:
+    """Format a whole-second timestamp as an ISO 8601 string, memoized for bursts within the same second"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+
+def _resolve_pointer(document: Any, pointer: str) -> Any:
+    """Get the value at a JSON pointer ("/a/0/b") in a parsed document, or None if it is absent"""
+    if pointer and not pointer.startswith("/"):
+        return None
+    node = document
+    for token in pointer.split("/")[1:]:
+        token = token.replace("~1", "/").replace("~0", "~")
+        if isinstance(node, dict):
+            node = node.get(token)
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            return None
+    return node
+
+def _is_solana_address(address: str) -> bool:
+    """Check that an address is base58 that decodes to exactly 32 bytes, without the base58 package"""
+    if not _SOLANA_ADDRESS_RE.fullmatch(address):
+        return False
+    value = 0
+    for char in address:
+        value = value * 58 + _B58_DIGITS[char]
+    # Each leading "1" encodes a leading zero byte
+    zero_bytes = len(address) - len(address.lstrip("1"))
+    return zero_bytes + (value.bit_length() + 7) // 8 == 32
+
+def _is_evm_address(address: str) -> bool:
+    """Check that an address is 0x followed by 40 hex digits, as on Ethereum and Polygon"""
+    return _EVM_ADDRESS_RE.fullmatch(address) is not None
+
+# Lowercase chain name -> address validator
+_ADDRESS_VALIDATORS = {
+    "solana": _is_solana_address,
+    "ethereum": _is_evm_address,
+    "polygon": _is_evm_address
+}
+
+class SocialFiBaseTool(SolanaClientMixin, BaseTool):
     """
     Base class for SocialFi integration tools.
     Provides common functionality for social token and community tools.
     """
     name = "socialfi_base"
     description = "Base class for SocialFi tools. Not meant to be used directly."
+    _tool_family = "SocialFi"
+    # Most SocialFi actions never sign, so the key file is only read when the wallet is needed
+    _lazy_wallet = True
+    
+    __slots__ = ("indexer_api_key", "cache_stats", "_host_cooldown")
+    
+    # (URL, sorted header items) -> (JSON data, expiry timestamp), shared by all SocialFi tools
+    _json_cache = {}
     
     def __init__(self, 
                  rpc_url: str = "https://api.mainnet-beta.solana.com",
                  private_key_path: Optional[str] = None,
                  indexer_api_key: Optional[str] = None,
                  **kwargs):
-        super().__init__(**kwargs)
-        self.rpc_url = rpc_url
-        self.private_key_path = private_key_path
         self.indexer_api_key = indexer_api_key
-        self._client = None
-        self._keypair = None
-        self._wallet_address = None
-        
-        # Initialize blockchain client
-        self._initialize_client()
-        
-        # Load wallet if private key is provided
-        if private_key_path:
+        # Hits and misses of the fetch_json cache
+        self.cache_stats = {"hits": 0, "misses": 0}
+        # Host -> time until which requests to it fail fast instead of going out
+        self._host_cooldown = {}
+        super().__init__(rpc_url=rpc_url, private_key_path=private_key_path, **kwargs)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_HTTP_RETRY)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+    
+    @property
+    def keypair(self):
+        """Wallet keypair, loaded from private_key_path on first use; None without a key file"""
+        if self._keypair is None and self.private_key_path:
             self._load_wallet()
+        return self._keypair
     
-    def _initialize_client(self):
-        """Initialize blockchain client"""
-        try:
-            # We're using dynamic imports to handle optional dependencies
-            from solana.rpc.api import Client
-            self._client = Client(self.rpc_url)
-            logging.info(f"Solana client initialized with RPC URL: {self.rpc_url}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for SocialFi tools. Install with 'pip install solana'")
-    
-    def _load_wallet(self):
-        """Load wallet from private key file"""
-        try:
-            from solana.keypair import Keypair
-            
-            try:
-                with open(self.private_key_path, 'r') as f:
-                    private_key_json = json.load(f)
-                    private_key_bytes = bytes(private_key_json)
-                    self._keypair = Keypair.from_secret_key(private_key_bytes)
-                    self._wallet_address = str(self._keypair.public_key)
-                    logging.info(f"Wallet loaded with address: {self._wallet_address}")
-            except Exception as e:
-                logging.error(f"Error loading wallet: {e}")
-                raise ValueError(f"Failed to load wallet from {self.private_key_path}: {e}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for wallet functionality")
+    @property
+    def wallet_address(self) -> Optional[str]:
+        """Base58 wallet address, loaded from private_key_path on first use; None without a key file"""
+        if self._wallet_address is None and self.private_key_path:
+            self._load_wallet()
+        return self._wallet_address
     
     def fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        """Fetch JSON data from a URL"""
+        """Fetch JSON data from a URL, served from the shared cache when possible"""
+        key = (url, tuple(sorted(headers.items())) if headers else ())
+        cached = self._cached_json(key)
+        if cached is not None:
+            return cached
+        
+        if self._host_cooling_down(url):
+            return {}
+        
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            # Streamed so an error status returns before any body is downloaded
+            with self._http.get(url, headers=headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                if response.headers.get("Content-Length") == "0":
+                    return {}
+                data = _json_loads(response.content)
+            self._cache_json(key, data)
+            return data
         except Exception as e:
-            logging.error(f"Error fetching JSON from {url}: {e}")
+            logger.error("Error fetching JSON from %s: %s", url, e)
+            self._trip_breaker(url, e)
             return {}
     
+    def _cached_json(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of cached JSON, or None if it is missing or expired"""
+        entry = self._json_cache.get(key)
+        if entry is None or entry[1] <= time.time():
+            self.cache_stats["misses"] += 1
+            return None
+        self.cache_stats["hits"] += 1
+        # Callers may modify the returned data, so never hand out the cached object
+        return copy.deepcopy(entry[0])
+    
+    def _cache_json(self, key: tuple, data: Dict[str, Any]) -> None:
+        """Cache fetched JSON for _JSON_CACHE_TTL seconds"""
+        # Drop any expired entry first so re-inserting moves the key to the newest position
+        self._json_cache.pop(key, None)
+        if len(self._json_cache) >= _JSON_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._json_cache[next(iter(self._json_cache))]
+        self._json_cache[key] = (copy.deepcopy(data), time.time() + _JSON_CACHE_TTL)
+    
     def post_json(self, url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Post JSON data to a URL"""
+        if self._host_cooling_down(url):
+            return {}
+        
+        try:
+            body, body_headers = _json_body(data, headers or {})
+            with self._http.post(url, data=body, headers=body_headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                # A 204 carries no Content-Length header at all
+                if response.status_code == 204 or response.headers.get("Content-Length") == "0":
+                    return {}
+                return _json_loads(response.content)
+        except Exception as e:
+            logger.error("Error posting JSON to %s: %s", url, e)
+            self._trip_breaker(url, e)
+            return {}
+    
+    def fetch_json_keys(self, url: str, pointers: List[str], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Fetch a JSON document and return only the values at the given JSON pointers, None for absent ones"""
+        if self._host_cooling_down(url):
+            return {}
+        
         try:
-            response = requests.post(url, json=data, headers=headers, timeout=10)
+            response = self._http.get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            return response.json()
         except Exception as e:
-            logging.error(f"Error posting JSON to {url}: {e}")
+            logger.error("Error fetching JSON from %s: %s", url, e)
+            self._trip_breaker(url, e)
+            return {}
+        
+        try:
+            if simdjson is None:
+                # Without pysimdjson, parse the whole document and walk each pointer
+                document = _json_loads(response.content)
+                return {pointer: _resolve_pointer(document, pointer) for pointer in pointers}
+            
+            # On-demand parsing only builds Python objects for the requested subtrees
+            document = simdjson.Parser().parse(response.content)
+            values = {}
+            for pointer in pointers:
+                try:
+                    value = document.at_pointer(pointer) if pointer else document
+                except (LookupError, TypeError, ValueError):
+                    values[pointer] = None
+                    continue
+                # Copy proxies out now; they are invalidated once the parser is reused or freed
+                if isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                elif isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                values[pointer] = value
+            return values
+        except Exception as e:
+            logger.error("Error parsing JSON from %s: %s", url, e)
+            return {}
+    
+    def head_ok(self, url: str, headers: Optional[Dict[str, str]] = None) -> bool:
+        """Check that a URL answers a HEAD request without an error status, for liveness probes"""
+        try:
+            response = self._http.head(url, headers=headers, timeout=5, allow_redirects=False)
+            return response.status_code < 400
+        except Exception as e:
+            logger.warning("Health check of %s failed: %s", url, e)
+            return False
+    
+    def _host_cooling_down(self, url: str) -> bool:
+        """Check whether a URL's host is inside a circuit-breaker cooldown"""
+        host = urlsplit(url).netloc
+        until = self._host_cooldown.get(host)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._host_cooldown[host]
+            return False
+        logger.warning("Skipping request to %s: host is cooling down after repeated failures", host)
+        return True
+    
+    def _trip_breaker(self, url: str, error: Exception) -> None:
+        """Start a cooldown for a URL's host after a connection error, timeout or server error"""
+        if isinstance(error, HTTPError):
+            # Client errors say nothing about the host's health
+            if error.response is None or error.response.status_code < 500:
+                return
+        elif isinstance(error, ClientResponseError):
+            if error.status < 500:
+                return
+        elif not isinstance(error, (RequestConnectionError, RetryError, Timeout, ClientConnectionError, TimeoutError)):
+            return
+        cooldown = self.config.get("host_cooldown", _HOST_COOLDOWN)
+        self._host_cooldown[urlsplit(url).netloc] = time.monotonic() + cooldown
+    
+    async def async_fetch_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Fetch JSON data from a URL without blocking the event loop, sharing fetch_json's cache"""
+        key = (url, tuple(sorted(headers.items())) if headers else ())
+        cached = self._cached_json(key)
+        if cached is not None:
+            return cached
+        
+        if self._host_cooling_down(url):
+            return {}
+        
+        try:
+            session = await self._get_session()
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+            self._cache_json(key, data)
+            return data
+        except Exception as e:
+            logger.error("Error fetching JSON from %s: %s", url, e)
+            self._trip_breaker(url, e)
             return {}
     
-    def format_timestamp(self, timestamp: Optional[float] = None) -> str:
-        """Format a timestamp as ISO 8601 string"""
+    async def async_post_json(self, url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Post JSON data to a URL without blocking the event loop"""
+        if self._host_cooling_down(url):
+            return {}
+        
+        try:
+            session = await self._get_session()
+            body, body_headers = _json_body(data, headers or {})
+            async with session.post(url, data=body, headers=body_headers) as response:
+                response.raise_for_status()
+                # A 204 carries no Content-Length header at all
+                if response.status == 204 or response.headers.get("Content-Length") == "0":
+                    return {}
+                return _json_loads(await response.read())
+        except Exception as e:
+            logger.error("Error posting JSON to %s: %s", url, e)
+            self._trip_breaker(url, e)
+            return {}
+    
+    async def fetch_many(self, urls: List[str], headers: Optional[Dict[str, str]] = None,
+                         concurrency: int = _FETCH_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Fetch JSON from many URLs concurrently, at most `concurrency` at a time, in the order given"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.async_fetch_json(url, headers)
+        
+        return await asyncio.gather(*(fetch(url) for url in urls))
+    
+    async def post_many(self, posts: List[Tuple[str, Dict[str, Any]]], headers: Optional[Dict[str, str]] = None,
+                        concurrency: int = _FETCH_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Post JSON bodies to many (url, data) pairs concurrently, at most `concurrency` at a time, in the order given"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def post(url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.async_post_json(url, data, headers)
+        
+        return await asyncio.gather(*(post(url, data) for url, data in posts))
+    
+    def get_multiple_balances(self, pubkeys: List[str]) -> List[Optional[int]]:
+        """Fetch the lamport balance of many accounts in batched RPC calls, None for missing accounts or failed lookups"""
+        return [
+            account["lamports"] if account else None
+            for account in self.get_multiple_accounts(pubkeys)
+        ]
+    
+    def format_timestamp(self, timestamp: Optional[float] = None, precise: bool = False) -> str:
+        """Format a timestamp as ISO 8601 string, to the second unless precise is set"""
         if timestamp is None:
             timestamp = time.time()
-        return datetime.fromtimestamp(timestamp).isoformat()
+        if not precise:
+            return _iso_second(int(timestamp))
+        second, fraction = divmod(timestamp, 1)
+        microseconds = round(fraction * 1_000_000)
+        if microseconds == 1_000_000:
+            second, microseconds = second + 1, 0
+        # Like datetime.isoformat, whole seconds get no fractional part
+        return _iso_second(int(second)) + (f".{microseconds:06d}" if microseconds else "")
     
     def is_valid_address(self, address: str, blockchain: str = "solana") -> bool:
         """Check if an address is valid for the specified blockchain"""
         if not address:
             return False
-            
-        if blockchain.lower() == "solana":
-            # Simple Solana address validation (base58 encoding, correct length)
-            import base58
-            try:
-                decoded = base58.b58decode(address)
-                return len(decoded) == 32
-            except:
-                return False
-        elif blockchain.lower() in ["ethereum", "polygon"]:
-            # Simple Ethereum address validation (0x prefix, hex string, correct length)
-            if address.startswith("0x") and len(address) == 42:
-                try:
-                    int(address[2:], 16)  # Check if hex string
-                    return True
-                except:
-                    return False
-            return False
-        else:
-            return False
+        
+        # Chain names are normally already lowercase, so only lowercase on a miss
+        validator = _ADDRESS_VALIDATORS.get(blockchain) or _ADDRESS_VALIDATORS.get(blockchain.lower())
+        return validator is not None and validator(address)
     
     def _simulate_api_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate an API response with standard metadata"""
@@ -123,3 +376,7 @@ class SocialFiBaseTool(BaseTool):
             "timestamp": self.format_timestamp(),
             "data": data
         }
+    
+    def _simulate_api_response_bytes(self, data: Dict[str, Any]) -> bytes:
+        """Simulate an API response already encoded as JSON, without building the wrapper dict"""
+        return b'{"success":true,"timestamp":"' + self.format_timestamp().encode() + b'","data":' + _json_dumps(data) + b'}'
@@ -0,0 +1,256 @@
+from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
+import asyncio
+import json
+import logging
+import os
+from requests import HTTPError
+
+try:
+    # orjson parses and encodes several times faster than the stdlib and works on bytes directly
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode a request body as compact UTF-8 JSON"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+try:
+    # Imported once here; without the package the names are None and client/wallet setup raise ImportError
+    from solana.rpc.api import Client
+    from solana.keypair import Keypair
+except ImportError:
+    Client = Keypair = None
+
+logger = logging.getLogger("anus.tools.web3.solana_client_mixin")
+
+# Headers sent with every JSON request body
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Maximum JSON-RPC calls sent in one batch request
+_RPC_BATCH_SIZE = 100
+
+# Seconds idle async connections and DNS lookups are kept for reuse
+_KEEPALIVE_TIMEOUT = 60
+_DNS_CACHE_TTL = 300
+
+# Per-call limits of getMultipleAccounts and getSignatureStatuses
+_MAX_ACCOUNTS_PER_CALL = 100
+_MAX_SIGNATURES_PER_CALL = 256
+
+def _json_body(params: Optional[Dict[str, Any]], headers: Dict[str, str]) -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Encode a POST body as JSON, returning (body, headers); no params means no body"""
+    if params is None:
+        return None, headers
+    # A Content-Type passed by the caller wins over the JSON default
+    if any(name.lower() == "content-type" for name in headers):
+        return _json_dumps(params), headers
+    return _json_dumps(params), {**headers, **_JSON_HEADERS}
+
+@lru_cache(maxsize=8)
+def _get_client(rpc_url: str):
+    """Create the Solana RPC client for an endpoint, shared by every tool in the process"""
+    if Client is None:
+        raise ImportError("solana")
+    return Client(rpc_url, timeout=10)
+
+@lru_cache(maxsize=16)
+def _load_keypair(path: str):
+    """Read a private key file and derive its keypair, once per resolved path"""
+    with open(path, 'rb') as f:
+        private_key_bytes = bytes(_json_loads(f.read()))
+    return Keypair.from_secret_key(private_key_bytes)
+
+def _new_http_session():
+    """Create a requests session that pools keep-alive connections and retries transient failures"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class SolanaClientMixin:
+    """
+    Shared Solana plumbing for the Web3 base tools.
+    Provides the RPC client, wallet loading, pooled HTTP sessions and batched RPC calls.
+    """
+    __slots__ = ("rpc_url", "private_key_path", "_client", "_keypair", "_wallet_address",
+                 "_http", "_session", "_session_loop")
+    
+    # Tool family named in the "solana package required" error
+    _tool_family = "Web3"
+    
+    # Whether the wallet is loaded on first use rather than in __init__
+    _lazy_wallet = False
+    
+    def __init__(self,
+                 rpc_url: str = "https://api.mainnet-beta.solana.com",
+                 private_key_path: Optional[str] = None,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.rpc_url = rpc_url
+        self.private_key_path = private_key_path
+        self._client = None
+        self._keypair = None
+        self._wallet_address = None
+        # Pooled HTTP session reused by every synchronous request
+        self._http = _new_http_session()
+        # Shared aiohttp session for the async_* methods, created on first use
+        self._session = None
+        self._session_loop = None
+        
+        # Initialize blockchain client
+        self._initialize_client()
+        
+        # Load wallet if private key is provided
+        if private_key_path and not self._lazy_wallet:
+            self._load_wallet()
+    
+    def _initialize_client(self):
+        """Initialize blockchain client"""
+        try:
+            # Tools sharing an RPC URL share one client and its connection pool
+            self._client = _get_client(self.rpc_url)
+            logger.info("Solana client initialized with RPC URL: %s", self.rpc_url)
+        except ImportError:
+            logger.error("Solana package not installed. Please install with 'pip install solana'")
+            raise ImportError(f"Solana package required for {self._tool_family} tools. Install with 'pip install solana'")
+    
+    def _load_wallet(self):
+        """Load wallet from private key file"""
+        try:
+            # Checked first so a missing package raises ImportError rather than ValueError
+            if Keypair is None:
+                raise ImportError("solana")
+            
+            try:
+                self._keypair = _load_keypair(os.path.realpath(self.private_key_path))
+                self._wallet_address = str(self._keypair.public_key)
+                logger.info("Wallet loaded with address: %s", self._wallet_address)
+            except Exception as e:
+                logger.error("Error loading wallet: %s", e)
+                raise ValueError(f"Failed to load wallet from {self.private_key_path}: {e}")
+        except ImportError:
+            logger.error("Solana package not installed. Please install with 'pip install solana'")
+            raise ImportError("Solana package required for wallet functionality")
+    
+    def batch_rpc(self, calls: List[Tuple[str, List[Any]]]) -> List[Dict[str, Any]]:
+        """Send JSON-RPC calls as batch requests, returning one response object per call in order"""
+        batch_size = self.config.get("rpc_batch_size", _RPC_BATCH_SIZE)
+        responses = []
+        for start in range(0, len(calls), batch_size):
+            chunk = calls[start:start + batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "id": start + i, "method": method, "params": params}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            try:
+                response = self._http.post(self.rpc_url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=10)
+                # Plain status check; raise_for_status does extra work on every successful response
+                if response.status_code >= 400:
+                    raise HTTPError(f"{response.status_code} Error: {response.reason} for url: {response.url}", response=response)
+                # Batch responses may come back in any order, so match them by id
+                by_id = {item.get("id"): item for item in _json_loads(response.content)}
+            except Exception as e:
+                logger.error("Batch RPC error for %s: %s", self.rpc_url, e)
+                responses.extend({"error": str(e)} for _ in chunk)
+                continue
+            responses.extend(
+                by_id.get(start + i, {"error": "No response for request"})
+                for i in range(len(chunk))
+            )
+        return responses
+    
+    def get_multiple_accounts(self, pubkeys: List[str], encoding: str = "base64") -> List[Optional[Dict[str, Any]]]:
+        """Fetch account info for many public keys, None for missing accounts or failed lookups"""
+        calls = [
+            ("getMultipleAccounts", [pubkeys[start:start + _MAX_ACCOUNTS_PER_CALL], {"encoding": encoding}])
+            for start in range(0, len(pubkeys), _MAX_ACCOUNTS_PER_CALL)
+        ]
+        return self._flatten_rpc_values(calls, _MAX_ACCOUNTS_PER_CALL, len(pubkeys))
+    
+    def get_signature_statuses(self, signatures: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch the status of many transaction signatures, None for unknown or failed lookups"""
+        calls = self._signature_status_calls(signatures)
+        return self._flatten_rpc_values(calls, _MAX_SIGNATURES_PER_CALL, len(signatures))
+    
+    def _signature_status_calls(self, signatures: List[str]) -> List[Tuple[str, List[Any]]]:
+        """Build getSignatureStatuses calls of at most _MAX_SIGNATURES_PER_CALL signatures each"""
+        # Searching the history finds signatures that have left the node's recent status cache
+        return [
+            ("getSignatureStatuses", [signatures[start:start + _MAX_SIGNATURES_PER_CALL], {"searchTransactionHistory": True}])
+            for start in range(0, len(signatures), _MAX_SIGNATURES_PER_CALL)
+        ]
+    
+    def _flatten_rpc_values(self, calls: List[Tuple[str, List[Any]]], per_call: int, total: int) -> List[Optional[Dict[str, Any]]]:
+        """Run chunked list-valued RPC calls and concatenate their result values"""
+        values = []
+        for response in self.batch_rpc(calls):
+            expected = min(per_call, total - len(values))
+            if "result" in response:
+                values.extend(response["result"]["value"])
+            else:
+                logger.error("RPC error: %s", response.get('error'))
+                values.extend([None] * expected)
+        return values
+    
+    def rpc(self, method: str, params: Optional[List[Any]] = None) -> Dict[str, Any]:
+        """Send one JSON-RPC call over the pooled HTTP session and return its response object"""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+        response = self._http.post(self.rpc_url, data=_json_dumps(payload), headers=_JSON_HEADERS, timeout=10)
+        if response.status_code >= 400:
+            raise HTTPError(f"{response.status_code} Error: {response.reason} for url: {response.url}", response=response)
+        return _json_loads(response.content)
+    
+    async def async_rpc(self, method: str, params: Optional[List[Any]] = None) -> Dict[str, Any]:
+        """Send one JSON-RPC call over the shared aiohttp session and return its response object"""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+        session = await self._get_session()
+        async with session.post(self.rpc_url, data=_json_dumps(payload), headers=_JSON_HEADERS) as response:
+            response.raise_for_status()
+            return _json_loads(await response.read())
+    
+    async def _get_session(self):
+        """Get the aiohttp session for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            import aiohttp
+            # Keep warm connections and DNS answers around between bursts of requests,
+            # so a collection scan reuses sockets instead of reconnecting per burst
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=_DNS_CACHE_TTL
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._session_loop = loop
+        return self._session
+    
+    def close(self):
+        """Close the pooled HTTP session"""
+        self._http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    async def aclose(self):
+        """Close the shared aiohttp session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
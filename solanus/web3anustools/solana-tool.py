@@ -1,36 +1,121 @@
 from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import json
 import time
 import base64
 import logging
 from anus.tools.base.tool import BaseTool
 from anus.tools.base.tool_result import ToolResult
+from anus.tools.web3.solana_client_mixin import SolanaClientMixin, _MAX_SIGNATURES_PER_CALL
 
-class SolanaTool(BaseTool):
+try:
+    # Imported once here; without the packages the names are None and the actions needing them report ImportError
+    from solana.keypair import Keypair
+    from solana.publickey import PublicKey
+    from solana.rpc.types import TxOpts
+    from solana.system_program import CreateAccountParams, TransferParams, create_account, transfer
+    from solana.transaction import Transaction
+except ImportError:
+    Keypair = PublicKey = TxOpts = Transaction = None
+    CreateAccountParams = TransferParams = create_account = transfer = None
+
+try:
+    from spl.token.client import Token
+    from spl.token.constants import TOKEN_PROGRAM_ID
+    from spl.token.instructions import (
+        MintToParams, create_associated_token_account, create_mint, get_associated_token_address, mint_to
+    )
+except ImportError:
+    Token = TOKEN_PROGRAM_ID = MintToParams = create_mint = mint_to = None
+    create_associated_token_account = get_associated_token_address = None
+
+# Size in bytes of an SPL token mint account
+_MINT_ACCOUNT_SIZE = 82
+
+# Stands in for the loaded wallet's address among _ACTION_DISPATCH defaults
+_OWN_WALLET = object()
+
+# Worker threads that overlap independent blocking RPC calls within one action
+_rpc_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="solana-rpc")
+
+# Seconds between getSignatureStatuses polls, and how long to wait for confirmations by default
+_CONFIRM_POLL_INTERVAL = 0.5
+_CONFIRM_TIMEOUT = 60
+
+# Transaction states that won't change any more
+_SETTLED_STATES = frozenset(("failed", "confirmed", "finalized"))
+
+def _signature_state(status: Optional[Dict[str, Any]]) -> str:
+    """Summarize a getSignatureStatuses entry as pending, processed, confirmed, finalized or failed"""
+    if status is None:
+        return "pending"
+    if status.get("err") is not None:
+        return "failed"
+    return status.get("confirmationStatus") or "pending"
+
+class SolanaTool(SolanaClientMixin, BaseTool):
     """
     Tool for interacting with the Solana blockchain.
     Provides capabilities for wallet management, transactions, and contract interaction.
     """
     name = "solana"
     description = "Interact with the Solana blockchain, manage wallets, and execute transactions"
+    _tool_family = "Solana"
+    
+    # Action -> (handler method, {argument: default}), so execute() is a single dict lookup
+    _ACTION_DISPATCH = {
+        "get_balance": ("_get_balance", {"wallet_address": _OWN_WALLET}),
+        "create_wallet": ("_create_wallet", {}),
+        "transfer_sol": ("_transfer_sol", {"recipient_address": None, "amount": None}),
+        "get_token_balance": ("_get_token_balance", {"wallet_address": _OWN_WALLET, "token_address": None}),
+        "get_multiple_balances": ("_get_multiple_balances", {"wallet_addresses": None}),
+        "get_token_balances": ("_get_token_balances", {"wallet_address": _OWN_WALLET, "token_addresses": None}),
+        "transfer_token": ("_transfer_token", {"recipient_address": None, "token_address": None, "amount": None}),
+        "get_transaction": ("_get_transaction", {"transaction_signature": None}),
+        "confirm_transactions": ("_confirm_transactions", {"transaction_signatures": None}),
+        "get_account_info": ("_get_account_info", {"wallet_address": _OWN_WALLET}),
+        "create_token": ("_create_token", {
+            "token_name": None, "token_symbol": None, "token_decimals": 9, "token_supply": 0
+        }),
+        "mint_token": ("_mint_token", {"token_address": None, "recipient_address": _OWN_WALLET, "amount": None}),
+        "get_token_supply": ("_get_token_supply", {"token_address": None}),
+        "swap_tokens": ("_swap_tokens", {"from_token": None, "to_token": None, "amount": None, "slippage": 0.5}),
+        "provide_liquidity": ("_provide_liquidity", {
+            "token_a": None, "token_b": None, "amount_a": None, "amount_b": None
+        }),
+        "stake_sol": ("_stake_sol", {"amount": None, "validator": None}),
+        "create_nft": ("_create_nft", {"nft_metadata": {}}),
+        # SOL by default
+        "get_price": ("_get_price", {"token_address": "So11111111111111111111111111111111111111112"}),
+        "get_network_status": ("_get_network_status", {})
+    }
+    
+    # Actions with a native async handler, used by async_execute()
+    _ASYNC_ACTIONS = {
+        "get_balance": "_get_balance_async",
+        "get_transaction": "_get_transaction_async",
+        "get_account_info": "_get_account_info_async"
+    }
+    
+    # RPC URL -> rent-exempt minimum for a mint account, which only changes with the cluster's rent parameters
+    _mint_rent_exemption = {}
+    
+    # (RPC URL, mint address) -> token decimals, which are fixed when the mint is created
+    _mint_decimals = {}
+    
+    # (RPC URL, owner address, mint address) of associated token accounts known to exist
+    _known_token_accounts = set()
     
     def __init__(self, 
                  rpc_url: str = "https://api.mainnet-beta.solana.com", 
                  private_key_path: Optional[str] = None,
                  **kwargs):
-        super().__init__(**kwargs)
-        self.rpc_url = rpc_url
-        self.private_key_path = private_key_path
-        self._client = None
-        self._keypair = None
-        self._wallet_address = None
-        
-        # Initialize solana client
-        self._initialize_client()
-        
-        # Load wallet if private key is provided
-        if private_key_path:
-            self._load_wallet()
+        # Signature -> submit time of transactions sent without waiting for confirmation
+        self._pending_signatures = {}
+        # Signature -> _known_token_accounts key of the token account that transaction creates
+        self._pending_token_accounts = {}
+        super().__init__(rpc_url=rpc_url, private_key_path=private_key_path, **kwargs)
     
     @property
     def parameters(self) -> Dict:
@@ -44,7 +129,8 @@ class SolanaTool(BaseTool):
                         "transfer_token", "get_transaction", "get_account_info",
                         "create_token", "mint_token", "get_token_supply", "swap_tokens",
                         "provide_liquidity", "stake_sol", "unstake_sol", "create_nft",
-                        "get_price", "get_gas_estimate", "get_network_status"
+                        "get_price", "get_gas_estimate", "get_network_status",
+                        "get_multiple_balances", "get_token_balances", "confirm_transactions"
                     ],
                     "description": "The Solana blockchain action to perform"
                 },
@@ -52,6 +138,11 @@ class SolanaTool(BaseTool):
                     "type": "string",
                     "description": "Solana wallet address (Public key)"
                 },
+                "wallet_addresses": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Wallet addresses to look up in one batched request"
+                },
                 "recipient_address": {
                     "type": "string",
                     "description": "Recipient wallet address for transfers"
@@ -64,10 +155,20 @@ class SolanaTool(BaseTool):
                     "type": "string", 
                     "description": "SPL token mint address"
                 },
+                "token_addresses": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "SPL token mint addresses to look up in one batched request"
+                },
                 "transaction_signature": {
                     "type": "string",
                     "description": "Transaction signature to look up"
                 },
+                "transaction_signatures": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Transaction signatures to confirm; defaults to this tool's unconfirmed transactions"
+                },
                 "token_name": {
                     "type": "string",
                     "description": "Name for a new token"
@@ -104,165 +205,137 @@ class SolanaTool(BaseTool):
             "required": ["action"]
         }
     
-    def _initialize_client(self):
-        """Initialize Solana client"""
-        try:
-            # We're using dynamic imports to handle optional dependencies
-            from solana.rpc.api import Client
-            self._client = Client(self.rpc_url)
-            logging.info(f"Solana client initialized with RPC URL: {self.rpc_url}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for SolanaTool. Install with 'pip install solana'")
-    
-    def _load_wallet(self):
-        """Load wallet from private key file"""
-        try:
-            from solana.keypair import Keypair
-            
-            try:
-                with open(self.private_key_path, 'r') as f:
-                    private_key_json = json.load(f)
-                    private_key_bytes = bytes(private_key_json)
-                    self._keypair = Keypair.from_secret_key(private_key_bytes)
-                    self._wallet_address = str(self._keypair.public_key)
-                    logging.info(f"Wallet loaded with address: {self._wallet_address}")
-            except Exception as e:
-                logging.error(f"Error loading wallet: {e}")
-                raise ValueError(f"Failed to load wallet from {self.private_key_path}: {e}")
-        except ImportError:
-            logging.error("Solana package not installed. Please install with 'pip install solana'")
-            raise ImportError("Solana package required for wallet functionality")
-    
     def execute(self, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """Execute the Solana tool with the given parameters"""
         action = kwargs.get("action")
         
+        spec = self._ACTION_DISPATCH.get(action)
+        if spec is None:
+            return self._error(f"Unknown Solana action: {action}")
+        
+        method_name, defaults = spec
         try:
-            if action == "get_balance":
-                return self._get_balance(kwargs.get("wallet_address", self._wallet_address))
-            elif action == "create_wallet":
-                return self._create_wallet()
-            elif action == "transfer_sol":
-                return self._transfer_sol(
-                    recipient_address=kwargs.get("recipient_address"),
-                    amount=kwargs.get("amount")
-                )
-            elif action == "get_token_balance":
-                return self._get_token_balance(
-                    wallet_address=kwargs.get("wallet_address", self._wallet_address),
-                    token_address=kwargs.get("token_address")
-                )
-            elif action == "transfer_token":
-                return self._transfer_token(
-                    recipient_address=kwargs.get("recipient_address"),
-                    token_address=kwargs.get("token_address"),
-                    amount=kwargs.get("amount")
-                )
-            elif action == "get_transaction":
-                return self._get_transaction(kwargs.get("transaction_signature"))
-            elif action == "get_account_info":
-                return self._get_account_info(kwargs.get("wallet_address", self._wallet_address))
-            elif action == "create_token":
-                return self._create_token(
-                    token_name=kwargs.get("token_name"),
-                    token_symbol=kwargs.get("token_symbol"),
-                    token_decimals=kwargs.get("token_decimals", 9),
-                    token_supply=kwargs.get("token_supply", 0)
-                )
-            elif action == "mint_token":
-                return self._mint_token(
-                    token_address=kwargs.get("token_address"),
-                    recipient_address=kwargs.get("recipient_address", self._wallet_address),
-                    amount=kwargs.get("amount")
-                )
-            elif action == "get_token_supply":
-                return self._get_token_supply(kwargs.get("token_address"))
-            elif action == "swap_tokens":
-                return self._swap_tokens(
-                    from_token=kwargs.get("from_token"),
-                    to_token=kwargs.get("to_token"),
-                    amount=kwargs.get("amount"),
-                    slippage=kwargs.get("slippage", 0.5)
-                )
-            elif action == "provide_liquidity":
-                return self._provide_liquidity(
-                    token_a=kwargs.get("token_a"),
-                    token_b=kwargs.get("token_b"),
-                    amount_a=kwargs.get("amount_a"),
-                    amount_b=kwargs.get("amount_b")
-                )
-            elif action == "stake_sol":
-                return self._stake_sol(
-                    amount=kwargs.get("amount"),
-                    validator=kwargs.get("validator")
-                )
-            elif action == "create_nft":
-                return self._create_nft(
-                    nft_metadata=kwargs.get("nft_metadata", {})
-                )
-            elif action == "get_price":
-                return self._get_price(
-                    token_address=kwargs.get("token_address", "So11111111111111111111111111111111111111112")  # SOL by default
-                )
-            elif action == "get_network_status":
-                return self._get_network_status()
-            else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Unknown Solana action: {action}"
-                )
+            return getattr(self, method_name)(**self._action_args(defaults, kwargs))
         except Exception as e:
             logging.error(f"Error executing Solana action {action}: {e}")
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error=f"Error executing Solana action {action}: {str(e)}"
-            )
+            return self._error(f"Error executing Solana action {action}: {str(e)}")
+    
+    async def async_execute(self, **kwargs) -> Union[Dict[str, Any], ToolResult]:
+        """Execute the tool without blocking the event loop"""
+        action = kwargs.get("action")
+        
+        method_name = self._ASYNC_ACTIONS.get(action)
+        if method_name is not None:
+            _, defaults = self._ACTION_DISPATCH[action]
+            return await getattr(self, method_name)(**self._action_args(defaults, kwargs))
+        # Actions without a native async path run in a worker thread
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
+    def _error(self, message: str) -> ToolResult:
+        """Build an error result for this tool"""
+        return ToolResult(
+            tool_name=self.name,
+            status="error",
+            error=message
+        )
+    
+    def _action_args(self, defaults: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick an action's arguments out of kwargs, filling in its defaults"""
+        return {
+            key: kwargs[key] if key in kwargs else (self._wallet_address if default is _OWN_WALLET else default)
+            for key, default in defaults.items()
+        }
+    
+    async def execute_many(self, batch: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], ToolResult]]:
+        """Execute independent actions concurrently, returning their results in order"""
+        return await asyncio.gather(*(self.async_execute(**kwargs) for kwargs in batch))
+    
+    async def wait_for_confirmation(self, signatures: List[str], timeout: float = _CONFIRM_TIMEOUT) -> Dict[str, str]:
+        """Poll batched getSignatureStatuses until every transaction is confirmed or failed, or the timeout passes"""
+        states = dict.fromkeys(signatures, "pending")
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            waiting = [signature for signature, state in states.items() if state not in _SETTLED_STATES]
+            if not waiting or time.monotonic() >= deadline:
+                return states
+            
+            starts = range(0, len(waiting), _MAX_SIGNATURES_PER_CALL)
+            responses = await asyncio.gather(
+                *(self.async_rpc(method, params) for method, params in self._signature_status_calls(waiting)),
+                return_exceptions=True
+            )
+            for start, response in zip(starts, responses):
+                # A failed poll leaves its signatures waiting for the next one
+                if isinstance(response, Exception) or "result" not in response:
+                    logging.error(f"Error polling signature statuses: {response}")
+                    continue
+                for signature, status in zip(waiting[start:start + _MAX_SIGNATURES_PER_CALL], response["result"]["value"]):
+                    states[signature] = _signature_state(status)
+                    self._settle(signature, states[signature])
+            
+            await asyncio.sleep(_CONFIRM_POLL_INTERVAL)
+    
+    def _settle(self, signature: str, state: str) -> None:
+        """Stop tracking a transaction once its state is final, recording any token account it created"""
+        if state not in _SETTLED_STATES:
+            return
+        self._pending_signatures.pop(signature, None)
+        account_key = self._pending_token_accounts.pop(signature, None)
+        if account_key is not None and state != "failed":
+            self._known_token_accounts.add(account_key)
+    
+    def _send_transaction(self, transaction, *signers) -> Dict[str, Any]:
+        """Submit a signed transaction without waiting for it to confirm, remembering its signature"""
+        response = self._client.send_transaction(transaction, *signers, opts=TxOpts(skip_confirmation=True))
+        if "result" in response:
+            self._pending_signatures[response["result"]] = time.time()
+        return response
     
     def _get_balance(self, wallet_address: Optional[str] = None) -> ToolResult:
         """Get SOL balance for a wallet address"""
         if not wallet_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Wallet address is required"
-            )
+            return self._error("Wallet address is required")
         
         try:
-            response = self._client.get_balance(wallet_address)
-            if response["result"]["value"] is not None:
-                # Convert lamports to SOL (1 SOL = 10^9 lamports)
-                balance_lamports = response["result"]["value"]
-                balance_sol = balance_lamports / 10**9
-                
-                return ToolResult.success(
-                    tool_name=self.name,
-                    result={
-                        "wallet_address": wallet_address,
-                        "balance_lamports": balance_lamports,
-                        "balance_sol": balance_sol,
-                        "unit": "SOL"
-                    }
-                )
-            else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Failed to get balance for {wallet_address}"
-                )
+            return self._balance_result(wallet_address, self.rpc("getBalance", [wallet_address]))
         except Exception as e:
-            return ToolResult(
+            return self._error(f"Error getting balance: {str(e)}")
+    
+    async def _get_balance_async(self, wallet_address: Optional[str] = None) -> ToolResult:
+        """Get SOL balance for a wallet address without blocking the event loop"""
+        if not wallet_address:
+            return self._error("Wallet address is required")
+        
+        try:
+            return self._balance_result(wallet_address, await self.async_rpc("getBalance", [wallet_address]))
+        except Exception as e:
+            return self._error(f"Error getting balance: {str(e)}")
+    
+    def _balance_result(self, wallet_address: str, response: Dict[str, Any]) -> ToolResult:
+        """Build the get_balance result from a getBalance RPC response"""
+        if response["result"]["value"] is not None:
+            # Convert lamports to SOL (1 SOL = 10^9 lamports)
+            balance_lamports = response["result"]["value"]
+            balance_sol = balance_lamports / 10**9
+            
+            return ToolResult.success(
                 tool_name=self.name,
-                status="error",
-                error=f"Error getting balance: {str(e)}"
+                result={
+                    "wallet_address": wallet_address,
+                    "balance_lamports": balance_lamports,
+                    "balance_sol": balance_sol,
+                    "unit": "SOL"
+                }
             )
+        else:
+            return self._error(f"Failed to get balance for {wallet_address}")
     
     def _create_wallet(self) -> ToolResult:
         """Create a new Solana wallet"""
         try:
-            from solana.keypair import Keypair
+            if Keypair is None:
+                raise ImportError("solana")
             
             # Generate a new keypair
             new_keypair = Keypair()
@@ -288,45 +361,24 @@ class SolanaTool(BaseTool):
                 }
             )
         except ImportError:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Solana package not installed. Please install with 'pip install solana'"
-            )
+            return self._error("Solana package not installed. Please install with 'pip install solana'")
         except Exception as e:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error=f"Error creating wallet: {str(e)}"
-            )
+            return self._error(f"Error creating wallet: {str(e)}")
     
     def _transfer_sol(self, recipient_address: str, amount: float) -> ToolResult:
         """Transfer SOL to another wallet"""
         if not self._keypair:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Private key not loaded. Please load a wallet first."
-            )
+            return self._error("Private key not loaded. Please load a wallet first.")
         
         if not recipient_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Recipient address is required"
-            )
+            return self._error("Recipient address is required")
         
         if not amount or amount <= 0:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Valid amount is required (must be greater than 0)"
-            )
+            return self._error("Valid amount is required (must be greater than 0)")
         
         try:
-            from solana.transaction import Transaction
-            from solana.system_program import TransferParams, transfer
-            from solana.publickey import PublicKey
+            if Transaction is None:
+                raise ImportError("solana")
             
             # Convert amount to lamports
             lamports = int(amount * 10**9)
@@ -342,9 +394,7 @@ class SolanaTool(BaseTool):
             
             # Create and sign transaction
             transaction = Transaction().add(transfer_instruction)
-            transaction_signature = self._client.send_transaction(
-                transaction, self._keypair
-            )
+            transaction_signature = self._send_transaction(transaction, self._keypair)
             
             if "result" in transaction_signature:
                 tx_id = transaction_signature["result"]
@@ -352,56 +402,36 @@ class SolanaTool(BaseTool):
                     tool_name=self.name,
                     result={
                         "transaction_signature": tx_id,
-                        "from_address": str(self._keypair.public_key),
+                        "from_address": self._wallet_address,
                         "to_address": recipient_address,
                         "amount_sol": amount,
                         "status": "submitted"
                     }
                 )
             else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Failed to submit transaction: {transaction_signature.get('error', 'Unknown error')}"
-                )
+                return self._error(f"Failed to submit transaction: {transaction_signature.get('error', 'Unknown error')}")
         except ImportError:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Solana package not installed. Please install required packages."
-            )
+            return self._error("Solana package not installed. Please install required packages.")
         except Exception as e:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error=f"Error transferring SOL: {str(e)}"
-            )
+            return self._error(f"Error transferring SOL: {str(e)}")
     
     def _get_token_balance(self, wallet_address: str, token_address: str) -> ToolResult:
         """Get SPL token balance for a wallet address"""
         if not wallet_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Wallet address is required"
-            )
+            return self._error("Wallet address is required")
         
         if not token_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Token address is required"
-            )
+            return self._error("Token address is required")
         
         try:
-            from spl.token.client import Token
-            from solana.publickey import PublicKey
+            if Token is None:
+                raise ImportError("spl")
             
             # Create token client
             token_client = Token(
                 conn=self._client,
                 pubkey=PublicKey(token_address),
-                program_id=PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"),
+                program_id=TOKEN_PROGRAM_ID,
                 payer=None
             )
             
@@ -433,117 +463,204 @@ class SolanaTool(BaseTool):
                 }
             )
         except ImportError:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="SPL token package not installed. Please install with 'pip install spl'"
-            )
+            return self._error("SPL token package not installed. Please install with 'pip install spl'")
         except Exception as e:
-            return ToolResult(
+            return self._error(f"Error getting token balance: {str(e)}")
+    
+    def _get_multiple_balances(self, wallet_addresses: List[str]) -> ToolResult:
+        """Get SOL balances for many wallet addresses in batched getMultipleAccounts calls"""
+        if not wallet_addresses:
+            return self._error("Wallet addresses are required")
+        
+        try:
+            balances = []
+            # None marks an account that doesn't exist or couldn't be fetched
+            for wallet_address, account in zip(wallet_addresses, self.get_multiple_accounts(wallet_addresses)):
+                balance_lamports = account["lamports"] if account else None
+                balances.append({
+                    "wallet_address": wallet_address,
+                    "balance_lamports": balance_lamports,
+                    "balance_sol": balance_lamports / 10**9 if balance_lamports is not None else None
+                })
+            
+            return ToolResult.success(
                 tool_name=self.name,
-                status="error",
-                error=f"Error getting token balance: {str(e)}"
+                result={
+                    "balances": balances,
+                    "unit": "SOL"
+                }
             )
+        except Exception as e:
+            return self._error(f"Error getting balances: {str(e)}")
+    
+    def _get_token_balances(self, wallet_address: str, token_addresses: List[str]) -> ToolResult:
+        """Get the wallet's balance of many SPL tokens in one batched RPC request"""
+        if not wallet_address:
+            return self._error("Wallet address is required")
+        
+        if not token_addresses:
+            return self._error("Token addresses are required")
+        
+        calls = [
+            ("getTokenAccountsByOwner", [wallet_address, {"mint": token_address}, {"encoding": "jsonParsed"}])
+            for token_address in token_addresses
+        ]
+        balances = []
+        for token_address, response in zip(token_addresses, self.batch_rpc(calls)):
+            if "result" not in response:
+                balances.append({"token_address": token_address, "error": str(response.get("error"))})
+                continue
+            
+            token_accounts = response["result"]["value"]
+            if not token_accounts:
+                balances.append({"token_address": token_address, "balance": 0})
+                continue
+            
+            # Balance of the first token account, as in get_token_balance
+            token_amount = token_accounts[0]["account"]["data"]["parsed"]["info"]["tokenAmount"]
+            balances.append({
+                "token_address": token_address,
+                "balance": float(token_amount["uiAmount"]),
+                "decimals": token_amount["decimals"]
+            })
+        
+        return ToolResult.success(
+            tool_name=self.name,
+            result={
+                "wallet_address": wallet_address,
+                "balances": balances
+            }
+        )
+    
+    def _confirm_transactions(self, transaction_signatures: Optional[List[str]] = None) -> ToolResult:
+        """Check the status of many transactions in batched getSignatureStatuses calls"""
+        # By default, check every transaction this tool sent that hasn't settled yet
+        signatures = transaction_signatures or list(self._pending_signatures)
+        
+        transactions = []
+        starts = range(0, len(signatures), _MAX_SIGNATURES_PER_CALL)
+        for start, response in zip(starts, self.batch_rpc(self._signature_status_calls(signatures))):
+            chunk = signatures[start:start + _MAX_SIGNATURES_PER_CALL]
+            # A failed lookup says nothing about the transactions, so report it instead of calling them pending
+            if "result" not in response:
+                transactions.extend(
+                    {"transaction_signature": signature, "status": "error", "error": response.get("error", "Unknown error")}
+                    for signature in chunk
+                )
+                continue
+            for signature, status in zip(chunk, response["result"]["value"]):
+                state = _signature_state(status)
+                self._settle(signature, state)
+                transactions.append({
+                    "transaction_signature": signature,
+                    "status": state,
+                    "error": status.get("err") if status else None
+                })
+        
+        return ToolResult.success(
+            tool_name=self.name,
+            result={
+                "transactions": transactions,
+                "pending": len(self._pending_signatures)
+            }
+        )
     
     def _get_transaction(self, transaction_signature: str) -> ToolResult:
         """Get transaction details by signature"""
         if not transaction_signature:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Transaction signature is required"
-            )
+            return self._error("Transaction signature is required")
         
         try:
-            response = self._client.get_transaction(transaction_signature)
-            
-            if "result" in response and response["result"]:
-                return ToolResult.success(
-                    tool_name=self.name,
-                    result={
-                        "transaction_signature": transaction_signature,
-                        "transaction_details": response["result"]
-                    }
-                )
-            else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Transaction not found: {transaction_signature}"
-                )
+            return self._transaction_result(transaction_signature, self.rpc("getTransaction", [transaction_signature]))
+        except Exception as e:
+            return self._error(f"Error retrieving transaction: {str(e)}")
+    
+    async def _get_transaction_async(self, transaction_signature: str) -> ToolResult:
+        """Get transaction details by signature without blocking the event loop"""
+        if not transaction_signature:
+            return self._error("Transaction signature is required")
+        
+        try:
+            response = await self.async_rpc("getTransaction", [transaction_signature])
+            return self._transaction_result(transaction_signature, response)
         except Exception as e:
-            return ToolResult(
+            return self._error(f"Error retrieving transaction: {str(e)}")
+    
+    def _transaction_result(self, transaction_signature: str, response: Dict[str, Any]) -> ToolResult:
+        """Build the get_transaction result from a getTransaction RPC response"""
+        if "result" in response and response["result"]:
+            return ToolResult.success(
                 tool_name=self.name,
-                status="error",
-                error=f"Error retrieving transaction: {str(e)}"
+                result={
+                    "transaction_signature": transaction_signature,
+                    "transaction_details": response["result"]
+                }
             )
+        else:
+            return self._error(f"Transaction not found: {transaction_signature}")
     
     def _get_account_info(self, wallet_address: str) -> ToolResult:
         """Get account information for a wallet address"""
         if not wallet_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Wallet address is required"
-            )
+            return self._error("Wallet address is required")
         
         try:
-            response = self._client.get_account_info(wallet_address, encoding="jsonParsed")
-            
-            if "result" in response and response["result"] and "value" in response["result"]:
-                return ToolResult.success(
-                    tool_name=self.name,
-                    result={
-                        "wallet_address": wallet_address,
-                        "account_info": response["result"]["value"]
-                    }
-                )
-            else:
-                return ToolResult.success(
-                    tool_name=self.name,
-                    result={
-                        "wallet_address": wallet_address,
-                        "account_info": None,
-                        "message": "Account not found or empty"
-                    }
-                )
+            response = self.rpc("getAccountInfo", [wallet_address, {"encoding": "jsonParsed"}])
+            return self._account_info_result(wallet_address, response)
         except Exception as e:
-            return ToolResult(
+            return self._error(f"Error retrieving account info: {str(e)}")
+    
+    async def _get_account_info_async(self, wallet_address: str) -> ToolResult:
+        """Get account information for a wallet address without blocking the event loop"""
+        if not wallet_address:
+            return self._error("Wallet address is required")
+        
+        try:
+            response = await self.async_rpc("getAccountInfo", [wallet_address, {"encoding": "jsonParsed"}])
+            return self._account_info_result(wallet_address, response)
+        except Exception as e:
+            return self._error(f"Error retrieving account info: {str(e)}")
+    
+    def _account_info_result(self, wallet_address: str, response: Dict[str, Any]) -> ToolResult:
+        """Build the get_account_info result from a getAccountInfo RPC response"""
+        if "result" in response and response["result"] and "value" in response["result"]:
+            return ToolResult.success(
+                tool_name=self.name,
+                result={
+                    "wallet_address": wallet_address,
+                    "account_info": response["result"]["value"]
+                }
+            )
+        else:
+            return ToolResult.success(
                 tool_name=self.name,
-                status="error",
-                error=f"Error retrieving account info: {str(e)}"
+                result={
+                    "wallet_address": wallet_address,
+                    "account_info": None,
+                    "message": "Account not found or empty"
+                }
             )
     
     def _create_token(self, token_name: str, token_symbol: str, token_decimals: int = 9, token_supply: float = 0) -> ToolResult:
         """Create a new SPL token"""
         if not self._keypair:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Private key not loaded. Please load a wallet first."
-            )
+            return self._error("Private key not loaded. Please load a wallet first.")
         
         if not token_name or not token_symbol:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Token name and symbol are required"
-            )
+            return self._error("Token name and symbol are required")
         
         try:
-            from spl.token.instructions import create_mint
-            from solana.system_program import CreateAccountParams, create_account
-            from solana.transaction import Transaction
-            from solana.publickey import PublicKey
-            import random
+            if Token is None:
+                raise ImportError("spl")
             
             # Create a new keypair for the token mint
-            from solana.keypair import Keypair
             mint_keypair = Keypair()
             
-            # Calculate minimum balance for rent exemption
-            resp = self._client.get_minimum_balance_for_rent_exemption(82)
-            lamports = resp["result"]
+            # Minimum balance for rent exemption, fetched once per RPC URL
+            lamports = self._mint_rent_exemption.get(self.rpc_url)
+            if lamports is None:
+                resp = self._client.get_minimum_balance_for_rent_exemption(_MINT_ACCOUNT_SIZE)
+                lamports = self._mint_rent_exemption[self.rpc_url] = resp["result"]
             
             # Create system account for token mint
             create_account_ix = create_account(
@@ -551,14 +668,14 @@ class SolanaTool(BaseTool):
                     from_pubkey=self._keypair.public_key,
                     new_account_pubkey=mint_keypair.public_key,
                     lamports=lamports,
-                    space=82,
-                    program_id=PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+                    space=_MINT_ACCOUNT_SIZE,
+                    program_id=TOKEN_PROGRAM_ID
                 )
             )
             
             # Create mint instruction
             create_mint_ix = create_mint(
-                program_id=PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"),
+                program_id=TOKEN_PROGRAM_ID,
                 mint=mint_keypair.public_key,
                 mint_authority=self._keypair.public_key,
                 freeze_authority=self._keypair.public_key,
@@ -569,18 +686,18 @@ class SolanaTool(BaseTool):
             transaction = Transaction().add(create_account_ix).add(create_mint_ix)
             
             # Sign and send transaction
-            transaction_signature = self._client.send_transaction(
-                transaction, self._keypair, mint_keypair
-            )
+            transaction_signature = self._send_transaction(transaction, self._keypair, mint_keypair)
             
             if "result" in transaction_signature:
                 tx_id = transaction_signature["result"]
+                # Base58-encode the new mint's address once for the follow-up mint and the result
+                token_address = str(mint_keypair.public_key)
                 
                 # If initial supply is specified, mint tokens
                 if token_supply > 0:
                     self._mint_token(
-                        token_address=str(mint_keypair.public_key),
-                        recipient_address=str(self._keypair.public_key),
+                        token_address=token_address,
+                        recipient_address=self._wallet_address,
                         amount=token_supply
                     )
                 
@@ -588,7 +705,7 @@ class SolanaTool(BaseTool):
                     tool_name=self.name,
                     result={
                         "transaction_signature": tx_id,
-                        "token_address": str(mint_keypair.public_key),
+                        "token_address": token_address,
                         "token_name": token_name,
                         "token_symbol": token_symbol,
                         "token_decimals": token_decimals,
@@ -597,98 +714,94 @@ class SolanaTool(BaseTool):
                     }
                 )
             else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Failed to create token: {transaction_signature.get('error', 'Unknown error')}"
-                )
+                return self._error(f"Failed to create token: {transaction_signature.get('error', 'Unknown error')}")
         except ImportError:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="SPL token package not installed. Please install required packages."
-            )
+            return self._error("SPL token package not installed. Please install required packages.")
         except Exception as e:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error=f"Error creating token: {str(e)}"
-            )
+            return self._error(f"Error creating token: {str(e)}")
     
     def _mint_token(self, token_address: str, recipient_address: str, amount: float) -> ToolResult:
         """Mint tokens to a recipient address"""
         if not self._keypair:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Private key not loaded. Please load a wallet first."
-            )
+            return self._error("Private key not loaded. Please load a wallet first.")
         
         if not token_address or not recipient_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Token address and recipient address are required"
-            )
+            return self._error("Token address and recipient address are required")
         
         if not amount or amount <= 0:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Valid amount is required (must be greater than 0)"
-            )
+            return self._error("Valid amount is required (must be greater than 0)")
         
         try:
-            from spl.token.client import Token
-            from spl.token.instructions import mint_to, MintToParams
-            from solana.publickey import PublicKey
-            from solana.transaction import Transaction
-            
-            # Get token info to determine decimals
-            token_info = self._get_token_supply(token_address)
-            if token_info.status == "error":
-                return token_info
+            if Token is None:
+                raise ImportError("spl")
+            
+            mint_pubkey = PublicKey(token_address)
+            recipient_pubkey = PublicKey(recipient_address)
+            
+            # The recipient's associated token account address is derived locally, without an RPC call
+            recipient_token_account = get_associated_token_address(recipient_pubkey, mint_pubkey)
+            account_key = (self.rpc_url, recipient_address, token_address)
+            
+            # Unless an earlier mint saw it, check whether the account exists, in the background
+            # since it doesn't depend on the decimals lookup below
+            account_lookup = None
+            if account_key not in self._known_token_accounts:
+                account_lookup = _rpc_pool.submit(
+                    self.rpc, "getAccountInfo",
+                    [str(recipient_token_account), {"encoding": "base64", "dataSlice": {"offset": 0, "length": 0}}]
+                )
             
-            token_decimals = token_info.result.get("decimals", 9)
+            # Get token info to determine decimals, unless an earlier lookup cached them
+            token_decimals = self._mint_decimals.get((self.rpc_url, token_address))
+            if token_decimals is None:
+                token_info = self._get_token_supply(token_address)
+                if token_info.status == "error":
+                    return token_info
+                
+                token_decimals = token_info.result.get("decimals", 9)
             
             # Convert amount to token units
             token_amount = int(amount * (10 ** token_decimals))
             
-            # Create token client
-            token_client = Token(
-                conn=self._client,
-                pubkey=PublicKey(token_address),
-                program_id=PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"),
-                payer=self._keypair
-            )
-            
-            # Get or create associated token account for recipient
-            recipient_token_account = token_client.get_or_create_associated_token_account(
-                owner=PublicKey(recipient_address)
-            )
+            creates_account = False
+            if account_lookup is not None:
+                response = account_lookup.result()
+                if "result" not in response:
+                    return self._error(f"Failed to look up recipient token account: {response.get('error', 'Unknown error')}")
+                creates_account = response["result"]["value"] is None
+            
+            transaction = Transaction()
+            if creates_account:
+                # Create the missing account in the same transaction as the mint
+                transaction.add(create_associated_token_account(
+                    payer=self._keypair.public_key,
+                    owner=recipient_pubkey,
+                    mint=mint_pubkey
+                ))
             
             # Create mint instruction
             mint_ix = mint_to(
                 MintToParams(
-                    program_id=PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"),
-                    mint=PublicKey(token_address),
-                    dest=recipient_token_account.value.address,
+                    program_id=TOKEN_PROGRAM_ID,
+                    mint=mint_pubkey,
+                    dest=recipient_token_account,
                     mint_authority=self._keypair.public_key,
                     amount=token_amount,
                     signers=[self._keypair.public_key]
                 )
             )
-            
-            # Create transaction
-            transaction = Transaction().add(mint_ix)
+            transaction.add(mint_ix)
             
             # Sign and send transaction
-            transaction_signature = self._client.send_transaction(
-                transaction, self._keypair
-            )
+            transaction_signature = self._send_transaction(transaction, self._keypair)
             
             if "result" in transaction_signature:
                 tx_id = transaction_signature["result"]
+                if creates_account:
+                    # Only known to exist once confirm_transactions or wait_for_confirmation sees the mint confirmed
+                    self._pending_token_accounts[tx_id] = account_key
+                else:
+                    self._known_token_accounts.add(account_key)
                 return ToolResult.success(
                     tool_name=self.name,
                     result={
@@ -700,42 +813,26 @@ class SolanaTool(BaseTool):
                     }
                 )
             else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Failed to mint tokens: {transaction_signature.get('error', 'Unknown error')}"
-                )
+                return self._error(f"Failed to mint tokens: {transaction_signature.get('error', 'Unknown error')}")
         except ImportError:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="SPL token package not installed. Please install required packages."
-            )
+            return self._error("SPL token package not installed. Please install required packages.")
         except Exception as e:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error=f"Error minting tokens: {str(e)}"
-            )
+            return self._error(f"Error minting tokens: {str(e)}")
     
     def _get_token_supply(self, token_address: str) -> ToolResult:
         """Get token supply and info"""
         if not token_address:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Token address is required"
-            )
+            return self._error("Token address is required")
         
         try:
-            from spl.token.client import Token
-            from solana.publickey import PublicKey
+            if Token is None:
+                raise ImportError("spl")
             
             # Create token client
             token_client = Token(
                 conn=self._client,
                 pubkey=PublicKey(token_address),
-                program_id=PublicKey("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"),
+                program_id=TOKEN_PROGRAM_ID,
                 payer=None
             )
             
@@ -749,6 +846,7 @@ class SolanaTool(BaseTool):
                 supply = mint_info.supply
                 decimals = mint_info.decimals
                 total_supply = supply / (10 ** decimals)
+                self._mint_decimals[(self.rpc_url, token_address)] = decimals
                 
                 return ToolResult.success(
                     tool_name=self.name,
@@ -762,62 +860,30 @@ class SolanaTool(BaseTool):
                     }
                 )
             else:
-                return ToolResult(
-                    tool_name=self.name,
-                    status="error",
-                    error=f"Token not found: {token_address}"
-                )
+                return self._error(f"Token not found: {token_address}")
         except ImportError:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="SPL token package not installed. Please install required packages."
-            )
+            return self._error("SPL token package not installed. Please install required packages.")
         except Exception as e:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error=f"Error getting token supply: {str(e)}"
-            )
+            return self._error(f"Error getting token supply: {str(e)}")
     
     def _swap_tokens(self, from_token: str, to_token: str, amount: float, slippage: float = 0.5) -> ToolResult:
         """Swap tokens using Raydium"""
         if not self._keypair:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Private key not loaded. Please load a wallet first."
-            )
+            return self._error("Private key not loaded. Please load a wallet first.")
         
-        return ToolResult(
-            tool_name=self.name,
-            status="error",
-            error="This feature is a placeholder. Full Raydium AMM integration requires off-chain preparation."
-        )
+        return self._error("This feature is a placeholder. Full Raydium AMM integration requires off-chain preparation.")
     
     def _provide_liquidity(self, token_a: str, token_b: str, amount_a: float, amount_b: float) -> ToolResult:
         """Provide liquidity to a Raydium pool"""
         if not self._keypair:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Private key not loaded. Please load a wallet first."
-            )
+            return self._error("Private key not loaded. Please load a wallet first.")
         
-        return ToolResult(
-            tool_name=self.name,
-            status="error",
-            error="This feature is a placeholder. Full Raydium liquidity provision requires off-chain preparation."
-        )
+        return self._error("This feature is a placeholder. Full Raydium liquidity provision requires off-chain preparation.")
     
     def _stake_sol(self, amount: float, validator: str) -> ToolResult:
         """Stake SOL with a validator"""
         if not self._keypair:
-            return ToolResult(
-                tool_name=self.name,
-                status="error",
-                error="Private key not loaded. Please load a wallet first."
-            )
+            return self._error("Private key not loaded. Please load a wallet first.")
         
         return ToolResult(
             tool_name=self.name,
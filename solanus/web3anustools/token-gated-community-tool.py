@@ -1,5 +1,4 @@
 from typing import Dict, Any, Optional, List, Union
-import json
 import logging
 import time
 import hashlib
@@ -7,6 +6,7 @@ import base64
 from datetime import datetime, timedelta
 from anus.tools.web3.socialfi_base_tool import SocialFiBaseTool
 from anus.tools.base.tool_result import ToolResult
+from anus.tools.web3.solana_client_mixin import _json_dumps, _json_loads
 
 class TokenGatedCommunityTool(SocialFiBaseTool):
     """
@@ -208,7 +208,7 @@ class TokenGatedCommunityTool(SocialFiBaseTool):
             "name": community_name,
             "description": description,
             "created_at": self.format_timestamp(),
-            "created_by": self._wallet_address or "anonymous",
+            "created_by": self.wallet_address or "anonymous",
             "requirements": {
                 "token_type": token_type,
                 "token_address": token_address,
@@ -216,7 +216,7 @@ class TokenGatedCommunityTool(SocialFiBaseTool):
                 "nft_collection_address": nft_collection_address
             },
             "members": {
-                "admins": [self._wallet_address] if self._wallet_address else [],
+                "admins": [self.wallet_address] if self.wallet_address else [],
                 "moderators": [],
                 "members": []
             },
@@ -257,7 +257,7 @@ class TokenGatedCommunityTool(SocialFiBaseTool):
         community = self.communities[community_id]
         
         # Check if caller is an admin
-        if self._wallet_address and self._wallet_address not in community["members"]["admins"]:
+        if self.wallet_address and self.wallet_address not in community["members"]["admins"]:
             return ToolResult(
                 tool_name=self.name,
                 status="error",
@@ -457,7 +457,7 @@ class TokenGatedCommunityTool(SocialFiBaseTool):
         self.access_tokens[token_id] = token_data
         
         # Create encoded token (simulated JWT)
-        encoded_token = base64.b64encode(json.dumps(token_data).encode()).decode()
+        encoded_token = base64.b64encode(_json_dumps(token_data)).decode()
         
         return ToolResult.success(
             tool_name=self.name,
@@ -484,8 +484,7 @@ class TokenGatedCommunityTool(SocialFiBaseTool):
         
         try:
             # Decode token
-            token_data_json = base64.b64decode(access_token).decode()
-            token_data = json.loads(token_data_json)
+            token_data = _json_loads(base64.b64decode(access_token))
             
             token_id = token_data.get("token_id")
             
@@ -628,7 +627,7 @@ class TokenGatedCommunityTool(SocialFiBaseTool):
         
         # Check if caller is authorized (only admins can add moderators/admins)
         if access_level in ["moderator", "admin"]:
-            if not self._wallet_address or self._wallet_address not in community["members"]["admins"]:
+            if not self.wallet_address or self.wallet_address not in community["members"]["admins"]:
                 return ToolResult(
                     tool_name=self.name,
                     status="error",